@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from benchmarking.analysis.accuracy import calculate_accuracy_metrics
-from benchmarking.analysis.mismatches import analyse_mismatches
+from benchmarking.analysis.accuracy import (
+    MatchStats,
+    calculate_accuracy_metrics,
+    collect_match_stats,
+    summarise_matches,
+)
+from benchmarking.analysis.mismatches import (
+    analyse_mismatches,
+    flag_incorrect_matches,
+)
 from benchmarking.analysis.reporting import print_stages_benchmark_header
 
 __all__ = [
+    "MatchStats",
     "calculate_accuracy_metrics",
+    "collect_match_stats",
     "analyse_mismatches",
+    "flag_incorrect_matches",
     "print_stages_benchmark_header",
+    "summarise_matches",
 ]
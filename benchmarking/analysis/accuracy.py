@@ -1,46 +1,82 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import duckdb
 
 
-def calculate_accuracy_metrics(
+@dataclass(frozen=True)
+class MatchStats:
+    """Headline counts for one set of match results."""
+
+    total_records: int
+    total_matched: int
+    correct_matches: int
+    incorrect_matches: int
+
+
+def summarise_matches(
     matches: duckdb.DuckDBPyRelation,
 ) -> duckdb.DuckDBPyRelation:
-    dataset_column: str | None = None
-    if "dataset_name" in matches.columns:
-        dataset_column = "dataset_name"
-    elif "source_dataset" in matches.columns:
-        dataset_column = "source_dataset"
+    """Return headline match counts from a single scan of ``matches``.
 
-    if dataset_column is None:
-        sql = """
-        WITH matched_records AS (
-            SELECT
-                unique_id,
-                resolved_canonical_id,
-                match_reason,
-                CASE WHEN unique_id = resolved_canonical_id THEN 1 ELSE 0 END AS is_correct
-            FROM matches
+    The result is a one-row relation with ``total_records``,
+    ``total_matched``, ``correct_matches`` and ``incorrect_matches``, letting
+    benchmark drivers check row counts and decide whether to run mismatch
+    analysis without re-scanning the match results for each figure.
+    """
+    sql = """
+    SELECT
+        COUNT(*) AS total_records,
+        COUNT(match_reason) AS total_matched,
+        COUNT(*) FILTER (
+            WHERE match_reason IS NOT NULL
+              AND unique_id = resolved_canonical_id
+        ) AS correct_matches,
+        COUNT(*) FILTER (
             WHERE match_reason IS NOT NULL
-        )
+              AND unique_id != resolved_canonical_id
+        ) AS incorrect_matches
+    FROM matches
+    """
+    return matches.query("matches", sql)
+
+
+def collect_match_stats(matches: duckdb.DuckDBPyRelation) -> MatchStats:
+    """Execute ``summarise_matches`` once and return the counts as ``MatchStats``."""
+    return MatchStats(*summarise_matches(matches).fetchone())
+
+
+# Columns that identify which source dataset a record came from, in order of
+# preference
+_DATASET_COLUMNS = ("dataset_name", "source_dataset")
+
+_ACCURACY_SQL = """
+    WITH matched_records AS (
         SELECT
-            CASE WHEN GROUPING(match_reason) = 1 THEN 'OVERALL' ELSE match_reason END AS match_reason,
-            COUNT(*) AS total_matched,
-            SUM(is_correct) AS correct_matches,
-            COUNT(*) - SUM(is_correct) AS incorrect_matches,
-            ROUND(COALESCE(100.0 * SUM(is_correct) / NULLIF(COUNT(*), 0), 0), 2) AS accuracy_pct
-        FROM matched_records
-        GROUP BY GROUPING SETS ((match_reason), ())
-        ORDER BY
-            CASE WHEN GROUPING(match_reason) = 1 THEN 0 ELSE 1 END,
-            total_matched DESC
-        """
-        return matches.query("accuracy", sql)
-
-    sql = f"""
+            unique_id,
+            resolved_canonical_id,
+            match_reason,
+            CASE WHEN unique_id = resolved_canonical_id THEN 1 ELSE 0 END AS is_correct
+        FROM matches
+        WHERE match_reason IS NOT NULL
+    )
+    SELECT
+        CASE WHEN GROUPING(match_reason) = 1 THEN 'OVERALL' ELSE match_reason END AS match_reason,
+        COUNT(*) AS total_matched,
+        SUM(is_correct) AS correct_matches,
+        COUNT(*) - SUM(is_correct) AS incorrect_matches,
+        ROUND(COALESCE(100.0 * SUM(is_correct) / NULLIF(COUNT(*), 0), 0), 2) AS accuracy_pct
+    FROM matched_records
+    GROUP BY GROUPING SETS ((match_reason), ())
+    ORDER BY
+        CASE WHEN GROUPING(match_reason) = 1 THEN 0 ELSE 1 END,
+        total_matched DESC
+"""
+
+_ACCURACY_BY_DATASET_SQL_TEMPLATE = """
     WITH matched_records AS (
         SELECT
             unique_id,
@@ -87,6 +123,23 @@ def calculate_accuracy_metrics(
             ELSE 1
         END,
         total_matched DESC
-    """
+"""
+
+# Render the per-dataset query for each supported column once at import
+_ACCURACY_BY_DATASET_SQL = {
+    column: _ACCURACY_BY_DATASET_SQL_TEMPLATE.format(dataset_column=column)
+    for column in _DATASET_COLUMNS
+}
+
+
+def calculate_accuracy_metrics(
+    matches: duckdb.DuckDBPyRelation,
+) -> duckdb.DuckDBPyRelation:
+    dataset_column = next(
+        (column for column in _DATASET_COLUMNS if column in matches.columns), None
+    )
+
+    if dataset_column is None:
+        return matches.query("accuracy", _ACCURACY_SQL)
 
-    return matches.query("accuracy", sql)
+    return matches.query("accuracy", _ACCURACY_BY_DATASET_SQL[dataset_column])
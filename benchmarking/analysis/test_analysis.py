@@ -7,7 +7,14 @@ they compile correctly and handle edge cases.
 
 import duckdb
 
-from benchmarking.analysis import analyse_mismatches, calculate_accuracy_metrics
+from benchmarking.analysis import (
+    MatchStats,
+    analyse_mismatches,
+    calculate_accuracy_metrics,
+    collect_match_stats,
+    summarise_matches,
+)
+from benchmarking.analysis.mismatches import print_mismatch_analysis
 
 
 def test_accuracy_calculation():
@@ -47,6 +54,34 @@ def test_accuracy_calculation():
     print("\n✓ Accuracy calculation test passed")
 
 
+def test_summarise_matches():
+    """Test headline counts are produced in one row."""
+    con = duckdb.connect(":memory:")
+
+    con.execute("""
+        CREATE TABLE test_matches AS
+        SELECT * FROM (VALUES
+            (1, 1, 'EXACT'),
+            (2, 999, 'EXACT'),  -- Mismatch
+            (3, 3, 'TRIE'),
+            (4, NULL, NULL)  -- Unmatched
+        ) AS t(unique_id, resolved_canonical_id, match_reason)
+    """)
+
+    summary = summarise_matches(con.table("test_matches"))
+
+    assert summary.columns == [
+        "total_records",
+        "total_matched",
+        "correct_matches",
+        "incorrect_matches",
+    ]
+    assert summary.fetchone() == (4, 3, 2, 1)
+    assert collect_match_stats(con.table("test_matches")) == MatchStats(4, 3, 2, 1)
+
+    print("\n✓ Match summary test passed")
+
+
 def test_mismatch_analysis():
     """Test mismatch analysis with Jaro-Winkler similarity."""
     con = duckdb.connect(":memory:")
@@ -55,9 +90,9 @@ def test_mismatch_analysis():
     con.execute("""
         CREATE TABLE test_matches AS
         SELECT * FROM (VALUES
-            (1, 999, 'EXACT', 100, '123 Main Street', 'SW1A 1AA'),
-            (2, 998, 'TRIE', 200, '456 Oak Avenue', 'SW1A 2BB')
-        ) AS t(unique_id, resolved_canonical_id, match_reason,
+            (1, 999, 'EXACT', 10, 100, '123 Main Street', 'SW1A 1AA'),
+            (2, 998, 'TRIE', 20, 200, '456 Oak Avenue', 'SW1A 2BB')
+        ) AS t(unique_id, resolved_canonical_id, match_reason, ukam_address_id,
                canonical_ukam_address_id, original_address_concat, postcode)
     """)
 
@@ -87,11 +122,101 @@ def test_mismatch_analysis():
     print("\n✓ Mismatch analysis test passed")
 
 
+def test_mismatch_analysis_results_are_independent_per_call():
+    """Earlier lazy results must not change when the analysis is rerun."""
+    con = duckdb.connect(":memory:")
+
+    canonical = con.sql("""
+        SELECT * FROM (VALUES
+            (100, '123 Main Road'),
+            (200, '789 Pine Street')
+        ) AS t(ukam_address_id, original_address_concat)
+    """)
+
+    def _matches(canonical_ukam_address_id):
+        return con.sql(f"""
+            SELECT
+                1 AS unique_id,
+                999 AS resolved_canonical_id,
+                'EXACT' AS match_reason,
+                10 AS ukam_address_id,
+                {canonical_ukam_address_id} AS canonical_ukam_address_id,
+                '123 Main Street' AS original_address_concat,
+                'SW1A 1AA' AS postcode
+        """)
+
+    first = analyse_mismatches(matches=_matches(100), canonical=canonical)
+    analyse_mismatches(matches=_matches(200), canonical=canonical)
+
+    worst = first["worst_mismatches"].project("predicted_address").fetchall()
+    assert worst == [("123 Main Road",)]
+
+
+def test_mismatch_analysis_limits_with_duplicate_ids():
+    """Duplicate ukam_address_ids must not fan out the returned rows."""
+    con = duckdb.connect(":memory:")
+
+    matches = con.sql("""
+        SELECT * FROM (VALUES
+            (1, 999, 'EXACT', 10, 100, '123 Main Street', 'SW1A 1AA'),
+            (2, 998, 'EXACT', 10, 200, '123 Main Street', 'SW1A 1AA')
+        ) AS t(unique_id, resolved_canonical_id, match_reason, ukam_address_id,
+               canonical_ukam_address_id, original_address_concat, postcode)
+    """)
+    canonical = con.sql("""
+        SELECT * FROM (VALUES
+            (100, '123 Main Road'),
+            (200, '789 Pine Street')
+        ) AS t(ukam_address_id, original_address_concat)
+    """)
+
+    results = analyse_mismatches(
+        matches=matches, canonical=canonical, samples_per_reason=1, top_worst=1
+    )
+
+    assert len(results["random_samples"].fetchall()) == 1
+    worst = results["worst_mismatches"].project("unique_id, predicted_address")
+    assert worst.fetchall() == [(2, "789 Pine Street")]
+
+
+def test_print_mismatch_analysis_uses_the_results_connection(capsys):
+    """Samples are printed from the analysis connection and drawn only once."""
+    con = duckdb.connect(":memory:")
+
+    matches = con.sql("""
+        SELECT
+            i AS unique_id,
+            -1 AS resolved_canonical_id,
+            CASE WHEN i % 2 = 0 THEN 'EXACT' ELSE 'TRIE' END AS match_reason,
+            i AS ukam_address_id,
+            100 AS canonical_ukam_address_id,
+            '123 Main Street' AS original_address_concat,
+            'SW1A 1AA' AS postcode
+        FROM range(100) AS t(i)
+    """)
+    canonical = con.sql(
+        "SELECT 100 AS ukam_address_id, '123 Main Road' AS original_address_concat"
+    )
+
+    results = analyse_mismatches(
+        matches=matches, canonical=canonical, samples_per_reason=3, top_worst=2
+    )
+
+    sample = sorted(results["random_samples"].fetchall())
+    assert sorted(results["random_samples"].fetchall()) == sample
+
+    print_mismatch_analysis(results)
+    output = capsys.readouterr().out
+    assert "EXACT (3 samples)" in output
+    assert "TRIE (3 samples)" in output
+
+
 if __name__ == "__main__":
     print("Testing benchmark analysis SQL queries...\n")
     print("=" * 80)
 
     test_accuracy_calculation()
+    test_summarise_matches()
     test_mismatch_analysis()
 
     print("\n" + "=" * 80)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from benchmarking.datasets.registry import DatasetInfo
 from benchmarking.datasets.lambeth_council import (
     LAMBETH_COUNCIL_INFO,
+    _resolve_lambeth_s3_base_path,
     get_lambeth_council_data,
 )
 from benchmarking.datasets.registry import (
     get_all_dataset_info,
     get_dataset_info,
+    get_dataset_source_location,
     list_datasets,
     load_dataset,
     register_dataset,
@@ -20,6 +24,7 @@ from benchmarking.datasets.sources import (
     SourceConfig,
     load_canonical_data,
 )
+import uk_address_matcher
 from uk_address_matcher.cleaning.pipelines import (
     clean_data_using_precomputed_rel_tok_freq,
     clean_data_with_minimal_steps,
@@ -29,7 +34,115 @@ if TYPE_CHECKING:
     import duckdb
 
 # Register available datasets
-register_dataset("lambeth_council", LAMBETH_COUNCIL_INFO, get_lambeth_council_data)
+register_dataset(
+    "lambeth_council",
+    LAMBETH_COUNCIL_INFO,
+    get_lambeth_council_data,
+    source_location=_resolve_lambeth_s3_base_path,
+)
+
+_CACHE_ALIAS = "benchmark_cache"
+
+
+def _attach_cache(
+    con: duckdb.DuckDBPyConnection, cache_path: Path, *, read_only: bool
+) -> None:
+    """Attach the on-disk benchmark cache under a fixed alias."""
+    con.execute(f"DETACH DATABASE IF EXISTS {_CACHE_ALIAS}")
+    options = " (READ_ONLY)" if read_only else ""
+    escaped_path = str(cache_path).replace("'", "''")
+    con.execute(f"ATTACH '{escaped_path}' AS {_CACHE_ALIAS}{options}")
+
+
+def _cleaning_code_digest() -> str:
+    """Hash the cleaning code and the bundled data files it reads."""
+    package_root = Path(uk_address_matcher.__file__).parent
+    files = sorted(
+        [
+            *(package_root / "cleaning").rglob("*.py"),
+            *(package_root / "data").iterdir(),
+        ]
+    )
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(str(file.relative_to(package_root)).encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _canonical_config(os_data_path: Path | None) -> CanonicalConfig:
+    return (
+        CanonicalConfig(local_path=os_data_path)
+        if os_data_path
+        else CanonicalConfig.default()
+    )
+
+
+def _cache_file(
+    cache_dir: Path,
+    dataset_name: str,
+    os_data_path: Path | None,
+    *,
+    include_term_frequencies: bool,
+    sample_mode: bool,
+) -> Path:
+    """Return the cache file for this combination of inputs and cleaning code.
+
+    Any change to the loading options, the resolved data locations, the
+    package version or the cleaning code gives a new file name. The data files
+    themselves are not hashed.
+    """
+    key = {
+        "dataset_name": dataset_name,
+        "dataset_source": get_dataset_source_location(dataset_name),
+        # Resolved the same way as when loading, so a path taken from
+        # UKAM_OS_CANONICAL_PATH is part of the key too
+        "canonical_path": str(_canonical_config(os_data_path).local_path.resolve()),
+        "include_term_frequencies": include_term_frequencies,
+        "sample_mode": sample_mode,
+        "version": uk_address_matcher.__version__,
+        "cleaning_code": _cleaning_code_digest(),
+    }
+    key_hash = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+    return cache_dir / f"{dataset_name}_{key_hash[:16]}.duckdb"
+
+
+def _prepare_benchmark_data(
+    con: duckdb.DuckDBPyConnection,
+    dataset_name: str,
+    os_data_path: Path | None,
+    *,
+    include_term_frequencies: bool,
+    sample_mode: bool,
+) -> tuple[duckdb.DuckDBPyRelation, duckdb.DuckDBPyRelation]:
+    """Load, sample and clean the messy data and load the canonical data."""
+    # Load raw messy data
+    df_messy = load_dataset(dataset_name, con)
+
+    # Apply deterministic sampling if requested (before cleaning for efficiency)
+    if sample_mode:
+        df_messy = con.sql(
+            "SELECT * FROM df_messy ORDER BY unique_id LIMIT 10000"
+        )
+
+    # Apply cleaning logic
+    if include_term_frequencies:
+        cleaning_function = clean_data_using_precomputed_rel_tok_freq
+    else:
+        cleaning_function = clean_data_with_minimal_steps
+
+    df_messy = cleaning_function(df_messy, con)
+
+    # Load canonical data once
+    df_canonical = load_canonical_data(con, _canonical_config(os_data_path))
+
+    # Apply deterministic sampling if requested
+    if sample_mode:
+        df_canonical = con.sql(
+            "SELECT * FROM df_canonical ORDER BY ukam_address_id LIMIT 1_000_000"
+        )
+
+    return df_messy, df_canonical
 
 
 def load_benchmark_data(
@@ -38,6 +151,7 @@ def load_benchmark_data(
     os_data_path: Path | None = None,
     include_term_frequencies: bool = False,
     sample_mode: bool = False,
+    cache_dir: Path | None = None,
 ) -> tuple[duckdb.DuckDBPyRelation, duckdb.DuckDBPyRelation]:
     """Load a benchmark dataset with messy and canonical data.
 
@@ -57,6 +171,14 @@ def load_benchmark_data(
     sample_mode:
         If True, load 100k canonical records and 10k messy records (deterministically).
         If False, load all records.
+    cache_dir:
+        Optional directory for an on-disk DuckDB cache of the cleaned messy and
+        canonical tables. The file name is derived from the dataset, the
+        loading options, the resolved messy and canonical data locations, the
+        package version and a hash of the cleaning code.
+        If a matching file exists it is read and no loading or cleaning is
+        run; otherwise the data is prepared as normal and written to it. If
+        None (the default), nothing is cached.
 
     Returns
     -------
@@ -66,37 +188,41 @@ def load_benchmark_data(
     print(f"Available datasets: {', '.join(list_datasets())}")
     print(f"Loading dataset: {dataset_name}\n")
 
-    # Load raw messy data
-    df_messy = load_dataset(dataset_name, con)
-
-    # Apply deterministic sampling if requested (before cleaning for efficiency)
-    if sample_mode:
-        df_messy = con.sql(
-            "SELECT * FROM df_messy ORDER BY unique_id LIMIT 10000"
+    cache_path = (
+        _cache_file(
+            cache_dir,
+            dataset_name,
+            os_data_path,
+            include_term_frequencies=include_term_frequencies,
+            sample_mode=sample_mode,
         )
-
-    # Apply cleaning logic
-    if include_term_frequencies:
-        cleaning_function = clean_data_using_precomputed_rel_tok_freq
-    else:
-        cleaning_function = clean_data_with_minimal_steps
-
-    df_messy = cleaning_function(df_messy, con)
-
-    # Load canonical data once
-    canonical_config = (
-        CanonicalConfig(local_path=os_data_path)
-        if os_data_path
-        else CanonicalConfig.default()
+        if cache_dir is not None
+        else None
     )
-    df_canonical = load_canonical_data(con, canonical_config)
 
-    # Apply deterministic sampling if requested
-    if sample_mode:
-        df_canonical = con.sql(
-            "SELECT * FROM df_canonical ORDER BY ukam_address_id LIMIT 1_000_000"
+    if cache_path is not None and cache_path.exists():
+        print(f"Reading cached benchmark data from {cache_path}")
+        _attach_cache(con, cache_path, read_only=True)
+        df_messy = con.table(f"{_CACHE_ALIAS}.messy_clean")
+        df_canonical = con.table(f"{_CACHE_ALIAS}.os_clean")
+    else:
+        df_messy, df_canonical = _prepare_benchmark_data(
+            con,
+            dataset_name,
+            os_data_path,
+            include_term_frequencies=include_term_frequencies,
+            sample_mode=sample_mode,
         )
 
+        if cache_path is not None:
+            print(f"Writing benchmark data cache to {cache_path}")
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _attach_cache(con, cache_path, read_only=False)
+            df_messy.to_table(f"{_CACHE_ALIAS}.messy_clean")
+            df_canonical.to_table(f"{_CACHE_ALIAS}.os_clean")
+            df_messy = con.table(f"{_CACHE_ALIAS}.messy_clean")
+            df_canonical = con.table(f"{_CACHE_ALIAS}.os_clean")
+
     # Show dataset info
     info = get_dataset_info(dataset_name)
     record_count = df_messy.count("*").fetchone()[0]
@@ -111,6 +237,7 @@ __all__ = [
     "CanonicalConfig",
     "SourceConfig",
     "get_dataset_info",
+    "get_dataset_source_location",
     "get_all_dataset_info",
     "list_datasets",
     "load_benchmark_data",
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 DatasetLoader = Callable[
     [duckdb.DuckDBPyConnection], duckdb.DuckDBPyRelation
 ]
+# Returns where the loader reads its raw data from (e.g. an S3 base path)
+SourceLocationResolver = Callable[[], str]
 
 
 @dataclass(frozen=True)
@@ -45,15 +47,23 @@ class RegisteredDataset:
     name: str
     info: DatasetInfo
     loader: DatasetLoader
+    source_location: SourceLocationResolver | None = None
 
 
 _DATASET_REGISTRY: dict[str, RegisteredDataset] = {}
 
 
-def register_dataset(name: str, info: DatasetInfo, loader: DatasetLoader) -> None:
+def register_dataset(
+    name: str,
+    info: DatasetInfo,
+    loader: DatasetLoader,
+    source_location: SourceLocationResolver | None = None,
+) -> None:
     if name in _DATASET_REGISTRY:
         raise ValueError(f"Dataset '{name}' is already registered")
-    _DATASET_REGISTRY[name] = RegisteredDataset(name=name, info=info, loader=loader)
+    _DATASET_REGISTRY[name] = RegisteredDataset(
+        name=name, info=info, loader=loader, source_location=source_location
+    )
 
 
 def get_dataset_info(name: str) -> DatasetInfo:
@@ -65,6 +75,17 @@ def get_dataset_info(name: str) -> DatasetInfo:
     return _DATASET_REGISTRY[name].info
 
 
+def get_dataset_source_location(name: str) -> str | None:
+    """Return where the dataset's raw data is read from, if it was registered."""
+    if name not in _DATASET_REGISTRY:
+        available = ", ".join(_DATASET_REGISTRY.keys())
+        raise ValueError(
+            f"Unknown dataset: {name}. Available datasets: {available or 'none'}"
+        )
+    source_location = _DATASET_REGISTRY[name].source_location
+    return source_location() if source_location is not None else None
+
+
 @lru_cache(maxsize=None)
 def load_dataset(
     name: str, con: duckdb.DuckDBPyConnection
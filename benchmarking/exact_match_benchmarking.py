@@ -6,6 +6,7 @@ import duckdb
 from benchmarking.analysis import (
     analyse_mismatches,
     calculate_accuracy_metrics,
+    collect_match_stats,
     print_stages_benchmark_header,
 )
 from benchmarking.analysis.mismatches import print_mismatch_analysis
@@ -23,6 +24,8 @@ from uk_address_matcher.sql_pipeline.runner import DebugOptions
 
 DATASET_NAME = "lambeth_council"
 OS_DATA_PATH: Path | None = None
+# Set to e.g. Path(".cache") to cache cleaned inputs between runs
+BENCHMARK_CACHE_DIR: Path | None = None
 # DEBUG_OPTIONS: Optional[DebugOptions] = DebugOptions(
 #     pretty_print_sql=True, debug_incremental=True, debug_mode=True, debug_show_sql=True
 # )
@@ -39,7 +42,9 @@ TOP_WORST_MISMATCHES = 10  # Worst mismatches by similarity
 
 print("Initialising benchmark environment...")
 con = setup_connection()
-df_messy_clean, df_os_clean = load_benchmark_data(con, DATASET_NAME, OS_DATA_PATH)
+df_messy_clean, df_os_clean = load_benchmark_data(
+    con, DATASET_NAME, OS_DATA_PATH, cache_dir=BENCHMARK_CACHE_DIR
+)
 
 # Get dataset info for reporting
 dataset_info = get_dataset_info(DATASET_NAME)
@@ -55,6 +60,9 @@ pipeline_variants = {
     },
 }
 
+# The input is shared by every variant, so count it once
+input_count = df_messy_clean.count("*").fetchone()[0]
+
 matches_by_variant: dict[str, duckdb.DuckDBPyRelation] = {}
 variant_timings: dict[str, dict[str, float]] = {}
 
@@ -75,14 +83,17 @@ for label, variant_spec in pipeline_variants.items():
             pipeline_name=f"Exact benchmark - {label}",
             debug_options=DEBUG_OPTIONS,
             explain=EXPLAIN,
+            table_name=f"matches_{label}",
         )
 
     pipeline_duration = variant_timings[label]["pipeline"]
     print(f"⏱  Pipeline completed in {pipeline_duration:.2f} seconds.\n")
 
+    # Headline counts in a single scan of the match results
+    stats = collect_match_stats(matches)
+    output_count = stats.total_records
+
     # Check row counts
-    input_count = df_messy_clean.count("*").fetchone()[0]
-    output_count = matches.count("*").fetchone()[0]
     if input_count == output_count:
         print(f"✓ Row counts match: {input_count:,} rows\n")
     else:
@@ -103,17 +114,9 @@ for label, variant_spec in pipeline_variants.items():
     accuracy.show()
 
     # Mismatch analysis (only if there are incorrect matches)
-    incorrect_count = (
-        matches.filter(
-            "match_reason IS NOT NULL AND unique_id != resolved_canonical_id"
-        )
-        .count("*")
-        .fetchone()[0]
-    )
-
-    if incorrect_count > 0:
+    if stats.incorrect_matches > 0:
         print(
-            f"\n📊 Found {incorrect_count:,} incorrect matches. Analysing mismatches...\n"
+            f"\n📊 Found {stats.incorrect_matches:,} incorrect matches. Analysing mismatches...\n"
         )
         mismatch_results = analyse_mismatches(
             matches=matches,
@@ -6,11 +6,13 @@ import duckdb
 from benchmarking.analysis import (
     analyse_mismatches,
     calculate_accuracy_metrics,
+    collect_match_stats,
 )
 from benchmarking.analysis.mismatches import print_mismatch_analysis
 from benchmarking.analysis.reporting import print_benchmark
 from benchmarking.datasets import get_dataset_info, load_benchmark_data
 from benchmarking.utils.io import setup_connection
+from benchmarking.utils.pipelines import materialise_matches
 from benchmarking.utils.timing import time_phase
 from uk_address_matcher.linking_model.exact_matching.matching_stages import (
     StageName,
@@ -25,6 +27,8 @@ from uk_address_matcher.sql_pipeline.runner import DebugOptions
 
 DATASET_NAME = "lambeth_council"
 OS_DATA_PATH: Path | None = None
+# Set to e.g. Path(".cache") to cache cleaned inputs between runs
+BENCHMARK_CACHE_DIR: Path | None = None
 DEBUG_OPTIONS: Optional[DebugOptions] = None
 # DEBUG_OPTIONS = DebugOptions(
 #     pretty_print_sql=True, debug_mode=True, debug_show_sql=True, debug_incremental=True
@@ -42,8 +46,9 @@ TOP_WORST_MISMATCHES = 10  # Worst mismatches by similarity
 
 print("Initialising benchmark environment...")
 con = setup_connection()
-# TODO(ThomasHepworth): LRU cache isn't working...
-df_messy_clean, df_os_clean = load_benchmark_data(con, DATASET_NAME, OS_DATA_PATH)
+df_messy_clean, df_os_clean = load_benchmark_data(
+    con, DATASET_NAME, OS_DATA_PATH, cache_dir=BENCHMARK_CACHE_DIR
+)
 
 
 # Get dataset info for reporting
@@ -74,6 +79,9 @@ for pipeline_variant in pipeline_variants:
             condition="ukam_address_id",
             how="left",
         )
+        matches = materialise_matches(
+            con, matches, f"matches_{pipeline_variant.value}"
+        )
         matches.show(max_width=200)
 
     pipeline_duration = variant_timings[pipeline_variant.value]["pipeline"]
@@ -91,17 +99,11 @@ for pipeline_variant in pipeline_variants:
     accuracy.show()
 
     # Mismatch analysis (only if there are incorrect matches)
-    incorrect_count = (
-        matches.filter(
-            "match_reason IS NOT NULL AND unique_id != resolved_canonical_id"
-        )
-        .count("*")
-        .fetchone()[0]
-    )
+    stats = collect_match_stats(matches)
 
-    if incorrect_count > 0:
+    if stats.incorrect_matches > 0:
         print(
-            f"\n📊 Found {incorrect_count:,} incorrect matches. Analysing mismatches...\n"
+            f"\n📊 Found {stats.incorrect_matches:,} incorrect matches. Analysing mismatches...\n"
         )
         mismatch_results = analyse_mismatches(
             matches=matches,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from benchmarking.analysis import flag_incorrect_matches
 from uk_address_matcher.linking_model.exact_matching import run_deterministic_match_pass
 
 if TYPE_CHECKING:
@@ -19,8 +20,13 @@ def run_deterministic_pipeline(
     pipeline_name: str,
     debug_options: Optional[DebugOptions] = None,
     explain: bool = False,
+    table_name: Optional[str] = None,
 ) -> duckdb.DuckDBPyRelation:
-    """Run deterministic matching pipeline using run_deterministic_match_pass."""
+    """Run deterministic matching pipeline using run_deterministic_match_pass.
+
+    When ``table_name`` is given the results are materialised (see
+    ``materialise_matches``) before being shown, so the pipeline executes once.
+    """
     if enabled_stage_names:
         print(f"Running with additional enabled stages: {enabled_stage_names}")
 
@@ -32,12 +38,38 @@ def run_deterministic_pipeline(
         debug_options=debug_options,
         explain=explain,
     )
+    if table_name is not None:
+        relation = materialise_matches(con, relation, table_name)
     show_relation(
         f"Final matches from deterministic pipeline: {pipeline_name}", relation
     )
     return relation
 
 
+def materialise_matches(
+    con: duckdb.DuckDBPyConnection,
+    matches: duckdb.DuckDBPyRelation,
+    table_name: str,
+) -> duckdb.DuckDBPyRelation:
+    """Persist match results as a temp table clustered by ``match_reason``.
+
+    The benchmark analysis runs several queries over the same matches. Reading
+    them from a table avoids re-running the pipeline for each one, and sorting
+    by ``match_reason`` then ``is_incorrect`` keeps row-group min/max
+    statistics tight for the per-reason filters. The ``is_incorrect`` flag is
+    added if the relation does not already carry it.
+    """
+    if "is_incorrect" not in matches.columns:
+        matches = flag_incorrect_matches(matches)
+
+    matches.query(
+        "matches",
+        f"CREATE OR REPLACE TEMP TABLE {table_name} AS "
+        "SELECT * FROM matches ORDER BY match_reason, is_incorrect",
+    )
+    return con.table(table_name)
+
+
 def show_relation(
     title: str,
     relation: duckdb.DuckDBPyRelation,
@@ -1,8 +1,19 @@
 import duckdb
+import pytest
 
 from uk_address_matcher.cleaning.steps import (
+    _add_term_frequencies_to_address_tokens,
+    _add_term_frequencies_to_address_tokens_using_registered_df,
+    _canonicalise_postcode,
+    _clean_address_string_first_pass,
+    _first_unusual_token,
+    _first_unusual_token_fallback,
+    _normalise_address_and_postcode,
     _parse_out_flat_position_and_letter,
     _remove_duplicate_end_tokens,
+    _trim_whitespace_address_and_postcode,
+    _upper_case_address_and_postcode,
+    _use_first_unusual_token_if_no_numeric_token,
 )
 from uk_address_matcher.sql_pipeline.runner import DebugOptions, DuckDBPipeline
 
@@ -125,3 +136,226 @@ def test_remove_duplicate_end_tokens():
         assert row[0] == expected, (
             f"Address '{address}' expected '{expected}' but got '{row[0]}'"
         )
+
+
+def test_clean_address_string_first_pass():
+    connection = duckdb.connect()
+    test_cases = [
+        (
+            "FLAT 2A, 10/12 HIGH ST. O''BRIEN ROAD",
+            "FLAT 2A 10-12 HIGH ST OBRIEN ROAD",
+        ),
+        ("UNIT 5/6 , THE  MEWS", "UNIT 5-6 THE MEWS"),
+        ("123 - B MAIN ST.  ", "123 - B MAIN ST"),
+        ("''S  , .", "S"),
+    ]
+
+    input_relation = connection.sql(
+        "SELECT * FROM (VALUES "
+        + ",".join(f"('{address}')" for address, _ in test_cases)
+        + ") AS t(address_concat)"
+    )
+
+    result = _run_single_stage(
+        _clean_address_string_first_pass, input_relation, connection
+    )
+    rows = result.fetchall()
+
+    for (address, expected), row in zip(test_cases, rows):
+        assert row[0] == expected, (
+            f"Address '{address}' expected '{expected}' but got '{row[0]}'"
+        )
+
+
+def test_normalise_address_and_postcode_matches_separate_stages():
+    connection = duckdb.connect()
+    input_relation = connection.sql(
+        """
+        SELECT * FROM (VALUES
+            ('1', '  flat 2a, 10-12 high st.  ', ' sw1a2aa '),
+            ('2', 'unit 5/6 o''brien rd', ' gir0aa'),
+            ('3', 'Flat B, 23 A  London Road', 'ec1a 1bb'),
+            ('4', NULL, NULL),
+            ('5', 'apt 3 the   mews', 'NOT A PC ')
+        ) AS t(unique_id, address_concat, postcode)
+        """
+    )
+
+    separate = DuckDBPipeline(connection, input_relation)
+    for stage_factory in (
+        _trim_whitespace_address_and_postcode,
+        _upper_case_address_and_postcode,
+        _canonicalise_postcode,
+        _clean_address_string_first_pass,
+    ):
+        separate.add_step(stage_factory())
+    expected = separate.run(DebugOptions(pretty_print_sql=False))
+
+    result = _run_single_stage(
+        _normalise_address_and_postcode, input_relation, connection
+    )
+
+    assert result.columns == expected.columns
+    assert sorted(result.fetchall()) == sorted(expected.fetchall())
+
+
+def test_first_unusual_token_fallback_matches_separate_stages():
+    connection = duckdb.connect()
+    input_relation = connection.sql(
+        """
+        SELECT * FROM (VALUES
+            ('1', '12', [{'tok': 'HIGH', 'rel_freq': 0.01}, {'tok': 'ZYX', 'rel_freq': 1e-5}]),
+            ('2', NULL, [{'tok': 'HIGH', 'rel_freq': 0.01}, {'tok': 'ZYX', 'rel_freq': 1e-5}]),
+            ('3', NULL, [{'tok': 'HIGH', 'rel_freq': 0.01}, {'tok': 'ROAD', 'rel_freq': 0.02}]),
+            ('4', NULL, [])
+        ) AS t(unique_id, numeric_token_1, token_rel_freq_arr)
+        """
+    )
+
+    separate = DuckDBPipeline(connection, input_relation)
+    separate.add_step(_first_unusual_token())
+    separate.add_step(_use_first_unusual_token_if_no_numeric_token())
+    expected = separate.run(DebugOptions(pretty_print_sql=False))
+
+    result = _run_single_stage(
+        _first_unusual_token_fallback, input_relation, connection
+    )
+
+    assert result.columns == expected.columns
+    assert sorted(result.fetchall()) == sorted(expected.fetchall())
+    assert ("2", "ZYX") in {(row[0], row[1]) for row in result.fetchall()}
+
+
+def _many_tokenised_addresses(connection):
+    # Enough rows for the exploded tokens to be aggregated across threads, with
+    # token order varying per row
+    return connection.sql(
+        """
+        SELECT
+            i::VARCHAR AS unique_id,
+            i AS ukam_address_id,
+            list_transform(
+                range(1 + i % 9),
+                j -> 'T' || ((i * 7919 + j * 104729) % 150000)::VARCHAR
+            ) AS address_without_numbers_tokenised
+        FROM range(200000) AS t(i)
+        """
+    )
+
+
+def test_precomputed_term_frequencies_stay_aligned_multithreaded(
+    duck_con_multithreaded,
+):
+    connection = duck_con_multithreaded
+    connection.register(
+        "rel_tok_freq_multithreaded",
+        connection.sql(
+            "SELECT 'T' || i::VARCHAR AS token, i / 1e6 AS rel_freq "
+            "FROM range(150000) AS t(i)"
+        ),
+    )
+    input_relation = _many_tokenised_addresses(connection)
+
+    result = _run_single_stage(
+        lambda: _add_term_frequencies_to_address_tokens_using_registered_df(
+            "rel_tok_freq_multithreaded"
+        ),
+        input_relation,
+        connection,
+    )
+
+    misaligned = connection.sql(
+        """
+        SELECT count(*)
+        FROM result AS r
+        JOIN input_relation AS i USING (unique_id)
+        WHERE list_transform(r.token_rel_freq_arr, x -> x.tok)
+                IS DISTINCT FROM i.address_without_numbers_tokenised
+           OR NOT list_bool_and(
+                list_transform(
+                    r.token_rel_freq_arr, x -> x.rel_freq = x.tok[2:]::INT / 1e6
+                )
+              )
+        """
+    ).fetchone()[0]
+    assert misaligned == 0
+    assert result.count("*").fetchone()[0] == 200000
+
+
+def test_on_the_fly_term_frequencies_stay_aligned_multithreaded(
+    duck_con_multithreaded,
+):
+    connection = duck_con_multithreaded
+    input_relation = _many_tokenised_addresses(connection)
+
+    result = _run_single_stage(
+        _add_term_frequencies_to_address_tokens, input_relation, connection
+    )
+
+    misaligned = connection.sql(
+        """
+        WITH expected AS (
+            SELECT token, count(*) / sum(count(*)) OVER () AS rel_freq
+            FROM (
+                SELECT unnest(address_without_numbers_tokenised) AS token
+                FROM input_relation
+            )
+            GROUP BY token
+        ),
+        actual AS (
+            SELECT
+                r.unique_id,
+                unnest(r.token_rel_freq_arr) AS pair,
+                generate_subscripts(r.token_rel_freq_arr, 1) AS token_order
+            FROM result AS r
+        )
+        SELECT count(*)
+        FROM actual AS a
+        JOIN input_relation AS i USING (unique_id)
+        JOIN expected AS e ON e.token = a.pair.tok
+        WHERE a.pair.tok != i.address_without_numbers_tokenised[a.token_order]
+           OR a.pair.rel_freq != e.rel_freq
+        """
+    ).fetchone()[0]
+    assert misaligned == 0
+
+
+@pytest.mark.parametrize(
+    "stage_factory",
+    [
+        _add_term_frequencies_to_address_tokens,
+        lambda: _add_term_frequencies_to_address_tokens_using_registered_df(
+            "rel_tok_freq_duplicate_ids"
+        ),
+    ],
+    ids=["on_the_fly", "precomputed"],
+)
+def test_term_frequencies_handle_duplicate_unique_ids(duck_con, stage_factory):
+    duck_con.register(
+        "rel_tok_freq_duplicate_ids",
+        duck_con.sql(
+            "SELECT * FROM (VALUES ('HIGH', 0.1), ('STREET', 0.2), ('LOW', 0.3)) "
+            "AS t(token, rel_freq)"
+        ),
+    )
+    # Two records share a unique_id but have different token lists
+    input_relation = duck_con.sql(
+        """
+        SELECT * FROM (
+            VALUES
+                ('1', 1, ['HIGH', 'STREET']),
+                ('1', 2, ['LOW', 'ROAD', 'STREET'])
+        ) AS t(unique_id, ukam_address_id, address_without_numbers_tokenised)
+        """
+    )
+
+    result = _run_single_stage(stage_factory, input_relation, duck_con)
+
+    rows = duck_con.sql(
+        """
+        SELECT ukam_address_id, list_transform(token_rel_freq_arr, x -> x.tok)
+        FROM result
+        ORDER BY ukam_address_id
+        """
+    ).fetchall()
+    assert rows == [(1, ["HIGH", "STREET"]), (2, ["LOW", "ROAD", "STREET"])]
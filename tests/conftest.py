@@ -9,8 +9,21 @@ logging.getLogger("splink").setLevel(logging.ERROR)
 
 @pytest.fixture
 def duck_con():
-    con = duckdb.connect(database=":memory:")
+    # Fixtures are tiny, so a single worker avoids spinning up a thread pool
+    # sized to the host for every test
+    con = duckdb.connect(database=":memory:", config={"threads": 1})
     con.execute("INSTALL splink_udfs FROM community; LOAD splink_udfs;")
 
     yield con
     con.close()
+
+
+@pytest.fixture
+def duck_con_multithreaded():
+    # duck_con runs on one worker, which would hide results that depend on row
+    # order. Tests over order-sensitive SQL (unordered list aggregates, arg_min)
+    # use this connection so parallel scheduling is exercised
+    con = duckdb.connect(database=":memory:", config={"threads": 4})
+
+    yield con
+    con.close()
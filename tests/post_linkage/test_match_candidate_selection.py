@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from uk_address_matcher.post_linkage.match_candidate_selection import (
+    _combine_exact_and_splink_matches,
     _prepare_splink_candidates,
     select_top_match_candidates,
 )
@@ -166,6 +167,78 @@ def test_prepare_splink_candidates_returns_top_results(
         )
 
 
+def test_prepare_splink_candidates_filters_before_ranking(
+    duck_con,
+    splink_candidates_with_duplicates,
+):
+    result = create_sql_pipeline(
+        con=duck_con,
+        input_rel=[InputBinding("splink_matches", splink_candidates_with_duplicates)],
+        stage_specs=[
+            _prepare_splink_candidates(
+                match_weight_threshold=0.0,
+                distinguishability_threshold=5.0,
+            ),
+        ],
+    ).run()
+
+    # Candidates below the thresholds are dropped before the top-1 selection,
+    # so the next-best eligible candidate wins rather than the ID disappearing
+    top_weights = dict(result.select("unique_id, match_weight::DOUBLE").fetchall())
+    assert top_weights == {1: 0.85, 2: 0.87, 3: 0.91, 4: 0.94}
+
+
+def test_prepare_splink_candidates_matches_window_ranking_multithreaded(
+    duck_con_multithreaded,
+):
+    # Many candidates per record, with tied weights and NULL distinguishability,
+    # aggregated across threads
+    candidates = duck_con_multithreaded.sql(
+        """
+        SELECT
+            (k * 7919 + r) % 5000 AS unique_id_l,
+            r AS unique_id_r,
+            (k * 7919 + r) % 5000 + 100000 AS ukam_address_id_l,
+            r AS ukam_address_id_r,
+            'ADDRESS ' || r::VARCHAR AS address_concat_r,
+            'SW1A 2AA' AS postcode_r,
+            ((k * 7 + r) % 3)::DOUBLE AS match_weight,
+            CASE WHEN (k + r) % 4 = 0 THEN NULL ELSE ((k * 11) % 3)::DOUBLE END
+                AS distinguishability,
+            'category' AS distinguishability_category
+        FROM (
+            -- 20 candidates for each of 20,000 records
+            SELECT i % 20000 AS r, i // 20000 AS k FROM range(400000) AS t(i)
+        )
+        """
+    )
+
+    result = create_sql_pipeline(
+        con=duck_con_multithreaded,
+        input_rel=[InputBinding("splink_matches", candidates)],
+        stage_specs=[
+            _prepare_splink_candidates(
+                match_weight_threshold=-100.0,
+                distinguishability_threshold=None,
+            ),
+        ],
+    ).run()
+
+    expected = duck_con_multithreaded.sql(
+        """
+        SELECT unique_id_r AS unique_id, unique_id_l AS resolved_canonical_id
+        FROM candidates
+        QUALIFY ROW_NUMBER() OVER (
+            PARTITION BY unique_id_r
+            ORDER BY match_weight DESC, distinguishability DESC NULLS LAST, unique_id_l
+        ) = 1
+        """
+    )
+
+    actual = result.select("unique_id, resolved_canonical_id")
+    assert sorted(actual.fetchall()) == sorted(expected.fetchall())
+
+
 # Confirms that we prioritise exact matches over Splink matches
 @pytest.mark.parametrize(
     "include_unmatched,expected_ids,unmatched_id_present",
@@ -227,6 +300,39 @@ def test_select_top_match_candidates_prioritises_exact_matches(
         assert pd.isna(unmatched_row["distinguishability"])
 
 
+def test_combine_stage_excludes_exact_matches_from_splink_candidates(
+    duck_con,
+    canonical_addresses_small,
+    exact_matches_with_duplicates,
+    splink_candidates_with_duplicates,
+):
+    # Without exclude_exact_matches the ranked candidates still include IDs 1-3,
+    # which are already exact matches; the combine stage must drop them itself
+    result = create_sql_pipeline(
+        con=duck_con,
+        input_rel=[
+            InputBinding("exact_matches", exact_matches_with_duplicates),
+            InputBinding("splink_matches", splink_candidates_with_duplicates),
+            InputBinding("canonical_addresses", canonical_addresses_small),
+        ],
+        stage_specs=[
+            _prepare_splink_candidates(
+                match_weight_threshold=-100.0,
+                distinguishability_threshold=None,
+            ),
+            _combine_exact_and_splink_matches(include_unmatched=False),
+        ],
+    ).run()
+
+    rows = result.select("unique_id, match_reason").order("unique_id").fetchall()
+    assert rows == [
+        (1, MatchReason.EXACT.value),
+        (2, MatchReason.EXACT.value),
+        (3, MatchReason.EXACT.value),
+        (4, MatchReason.SPLINK.value),
+    ]
+
+
 def test_select_top_match_candidates_handles_empty_splink_relation(
     duck_con,
     canonical_addresses_small,
@@ -70,6 +70,23 @@ def test_pipeline_execution_order(duck_con, base_rel):
     assert list(out_df.val) == [40, 60, 80]
 
 
+def test_run_without_checkpoints_is_single_statement(duck_con, base_rel):
+    pipe = DuckDBPipeline(duck_con, base_rel)
+    pipe.add_step(add_ten())
+    pipe.add_step(name_tuple_stage())
+
+    tables_before = duck_con.sql("SELECT count(*) FROM duckdb_tables()").fetchone()
+    result = pipe.run()
+
+    # Stages are fused into one WITH chain: nothing is materialised between them
+    assert not pipe._materialised_sql_blocks
+    assert result.sql_query().lstrip().upper().startswith("WITH")
+    assert (
+        duck_con.sql("SELECT count(*) FROM duckdb_tables()").fetchone()
+        == tables_before
+    )
+
+
 def test_debug_materialise_matches_final(duck_con, base_rel, capsys):
     pipe = DuckDBPipeline(duck_con, base_rel)
     pipe.add_step(add_ten())
@@ -6,8 +6,16 @@ from uk_address_matcher.post_linkage.analyse_results import (
 )
 
 
-def test_calculate_exact_match_metrics_basic_counts():
+# These tests only build read-only relations, so one connection per module is
+# enough. duck_con would also load the splink_udfs extension, which isn't used.
+@pytest.fixture(scope="module")
+def con():
     con = duckdb.connect(database=":memory:")
+    yield con
+    con.close()
+
+
+def test_calculate_exact_match_metrics_basic_counts(con):
     relation = con.sql(
         """
         SELECT *
@@ -35,8 +43,7 @@ def test_calculate_exact_match_metrics_basic_counts():
     assert pytest.approx(percentages["method_a"], rel=1e-6) == "33.33%"
 
 
-def test_calculate_exact_match_metrics_supports_ascending_order():
-    con = duckdb.connect(database=":memory:")
+def test_calculate_exact_match_metrics_supports_ascending_order(con):
     relation = con.sql(
         """
         SELECT *
@@ -53,8 +60,7 @@ def test_calculate_exact_match_metrics_supports_ascending_order():
     assert list(result_df["match_reason"]) == ["method_a", "method_b"]
 
 
-def test_calculate_exact_match_metrics_accepts_match_reason_column():
-    con = duckdb.connect(database=":memory:")
+def test_calculate_exact_match_metrics_accepts_match_reason_column(con):
     relation = con.sql(
         """
         SELECT *
@@ -76,8 +82,7 @@ def test_calculate_exact_match_metrics_accepts_match_reason_column():
     assert counts == {"exact: postcode": 2, "trie: fallback": 1}
 
 
-def test_calculate_exact_match_metrics_requires_column():
-    con = duckdb.connect(database=":memory:")
+def test_calculate_exact_match_metrics_requires_column(con):
     relation = con.sql("SELECT 1 AS different_column")
 
     with pytest.raises(ValueError):
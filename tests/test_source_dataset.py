@@ -144,3 +144,82 @@ def test_get_linker_raises_error_with_source_dataset():
         df_addresses_to_search_within=test_data_no_source,
         con=con,
     )
+
+
+def test_unmaterialised_cleaning_matches_materialised_output():
+    con = duckdb.connect(":memory:")
+    test_data = con.sql(
+        """
+        SELECT
+            '1' as unique_id,
+            'a' as source_dataset,
+            '10 DOWNING STREET LONDON' as address_concat,
+            'SW1A 2AA' as postcode
+        """
+    )
+
+    materialised = clean_data_using_precomputed_rel_tok_freq(test_data, con=con)
+    lazy = clean_data_using_precomputed_rel_tok_freq(
+        test_data, con=con, materialise=False
+    )
+
+    # The lazy relation is not backed by a temp table, but applies the same
+    # source_dataset exclusion and yields the same rows
+    assert "__address_table_cleaned" not in lazy.sql_query()
+    assert lazy.columns == materialised.columns
+    assert lazy.fetchall() == materialised.fetchall()
+
+
+def test_unmaterialised_cleaning_keeps_its_own_token_frequencies():
+    con = duckdb.connect(":memory:")
+    test_data = con.sql(
+        """
+        SELECT
+            '1' as unique_id,
+            '10 DOWNING STREET LONDON' as address_concat,
+            'SW1A 2AA' as postcode
+        """
+    )
+
+    def _downing_rel_freq(rel):
+        (hist,) = rel.project("token_rel_freq_arr_hist").fetchone()
+        return {t["tok"]: t["rel_freq"] for t in hist["key"]}["DOWNING"]
+
+    first = clean_data_using_precomputed_rel_tok_freq(
+        test_data,
+        con=con,
+        rel_tok_freq_table=con.sql("SELECT 'DOWNING' AS token, 0.25 AS rel_freq"),
+        materialise=False,
+    )
+    second = clean_data_using_precomputed_rel_tok_freq(
+        test_data,
+        con=con,
+        rel_tok_freq_table=con.sql("SELECT 'DOWNING' AS token, 0.5 AS rel_freq"),
+        materialise=False,
+    )
+
+    # Each lazy result resolves the frequency table it was built with, even
+    # though both are only executed after the second call
+    assert _downing_rel_freq(first) == 0.25
+    assert _downing_rel_freq(second) == 0.5
+
+
+def test_materialised_cleaning_drops_its_token_frequency_view():
+    con = duckdb.connect(":memory:")
+    test_data = con.sql(
+        """
+        SELECT
+            '1' as unique_id,
+            '10 DOWNING STREET LONDON' as address_concat,
+            'SW1A 2AA' as postcode
+        """
+    )
+
+    cleaned = clean_data_using_precomputed_rel_tok_freq(test_data, con=con)
+
+    leftover_views = con.sql(
+        "SELECT view_name FROM duckdb_views() "
+        "WHERE view_name LIKE 'rel_tok_freq_%'"
+    ).fetchall()
+    assert leftover_views == []
+    assert cleaned.count("*").fetchone()[0] == 1
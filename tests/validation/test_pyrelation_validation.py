@@ -7,14 +7,12 @@ from uk_address_matcher.sql_pipeline.validation import (
 )
 
 
-@pytest.fixture
-def required_schema() -> list[ColumnSpec]:
-    return [
-        ColumnSpec("unique_id", "BIGINT"),
-        ColumnSpec("source_dataset", "VARCHAR"),
-        ColumnSpec("address_concat", "VARCHAR"),
-        ColumnSpec("postcode", "VARCHAR"),
-    ]
+REQUIRED_SCHEMA = (
+    ColumnSpec("unique_id", "BIGINT"),
+    ColumnSpec("source_dataset", "VARCHAR"),
+    ColumnSpec("address_concat", "VARCHAR"),
+    ColumnSpec("postcode", "VARCHAR"),
+)
 
 
 @pytest.fixture
@@ -30,13 +28,13 @@ def valid_relation(duck_con):
     )
 
 
-def test_validate_table_accepts_valid_relation(valid_relation, required_schema):
-    errors = validate_table(valid_relation, required_schema)
+def test_validate_table_accepts_valid_relation(valid_relation):
+    errors = validate_table(valid_relation, REQUIRED_SCHEMA)
 
     assert errors == []
 
 
-def test_validate_table_reports_missing_and_type_mismatch(duck_con, required_schema):
+def test_validate_table_reports_missing_and_type_mismatch(duck_con):
     relation = duck_con.sql(
         """
         SELECT
@@ -48,7 +46,7 @@ def test_validate_table_reports_missing_and_type_mismatch(duck_con, required_sch
 
     errors = validate_table(
         relation,
-        required_schema,
+        REQUIRED_SCHEMA,
         raise_on_error=False,
     )
 
@@ -56,7 +54,7 @@ def test_validate_table_reports_missing_and_type_mismatch(duck_con, required_sch
     assert "[input_table] column 'unique_id': expected BIGINT, found VARCHAR" in errors
 
 
-def test_validate_table_accepts_length_qualified_varchar(duck_con, required_schema):
+def test_validate_table_accepts_length_qualified_varchar(duck_con):
     relation = duck_con.sql(
         """
         SELECT
@@ -69,15 +67,13 @@ def test_validate_table_accepts_length_qualified_varchar(duck_con, required_sche
 
     errors = validate_table(
         relation,
-        required_schema,
+        REQUIRED_SCHEMA,
         raise_on_error=False,
     )
     assert errors == []
 
 
-def test_validate_tables_returns_errors_per_relation(
-    valid_relation, duck_con, required_schema
-):
+def test_validate_tables_returns_errors_per_relation(valid_relation, duck_con):
     failing_relation = duck_con.sql(
         """
         SELECT
@@ -92,7 +88,7 @@ def test_validate_tables_returns_errors_per_relation(
             "companies_house": valid_relation,
             "fhrs": failing_relation,
         },
-        required_schema,
+        REQUIRED_SCHEMA,
         raise_on_error=False,
     )
 
@@ -1,29 +1,69 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0.dev21"
 
-from uk_address_matcher.cleaning.pipelines import (
-    clean_data_on_the_fly,
-    clean_data_using_precomputed_rel_tok_freq,
-    get_address_token_frequencies_from_address_table,
-    get_numeric_term_frequencies_from_address_table,
-)
-from uk_address_matcher.linking_model.exact_matching import (
-    StageName,
-    available_deterministic_stages,
-    run_deterministic_match_pass,
-)
-from uk_address_matcher.linking_model.splink_model import get_linker
-from uk_address_matcher.post_linkage.accuracy_from_labels import (
-    evaluate_predictions_against_labels,
-    inspect_match_results_vs_labels,
-)
-from uk_address_matcher.post_linkage.analyse_results import (
-    best_matches_summary,
-    best_matches_with_distinguishability,
-    calculate_match_metrics,
-)
-from uk_address_matcher.post_linkage.identify_distinguishing_tokens import (
-    improve_predictions_using_distinguishing_tokens,
-)
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. just to clean data, doesn't pay for importing splink
+_LAZY_IMPORTS = {
+    "clean_data_on_the_fly": "uk_address_matcher.cleaning.pipelines",
+    "clean_data_using_precomputed_rel_tok_freq": "uk_address_matcher.cleaning.pipelines",
+    "get_address_token_frequencies_from_address_table": "uk_address_matcher.cleaning.pipelines",
+    "get_numeric_term_frequencies_from_address_table": "uk_address_matcher.cleaning.pipelines",
+    "StageName": "uk_address_matcher.linking_model.exact_matching",
+    "available_deterministic_stages": "uk_address_matcher.linking_model.exact_matching",
+    "run_deterministic_match_pass": "uk_address_matcher.linking_model.exact_matching",
+    "get_linker": "uk_address_matcher.linking_model.splink_model",
+    "evaluate_predictions_against_labels": "uk_address_matcher.post_linkage.accuracy_from_labels",
+    "inspect_match_results_vs_labels": "uk_address_matcher.post_linkage.accuracy_from_labels",
+    "best_matches_summary": "uk_address_matcher.post_linkage.analyse_results",
+    "best_matches_with_distinguishability": "uk_address_matcher.post_linkage.analyse_results",
+    "calculate_match_metrics": "uk_address_matcher.post_linkage.analyse_results",
+    "improve_predictions_using_distinguishing_tokens": "uk_address_matcher.post_linkage.identify_distinguishing_tokens",
+}
+
+if TYPE_CHECKING:
+    from uk_address_matcher.cleaning.pipelines import (
+        clean_data_on_the_fly,
+        clean_data_using_precomputed_rel_tok_freq,
+        get_address_token_frequencies_from_address_table,
+        get_numeric_term_frequencies_from_address_table,
+    )
+    from uk_address_matcher.linking_model.exact_matching import (
+        StageName,
+        available_deterministic_stages,
+        run_deterministic_match_pass,
+    )
+    from uk_address_matcher.linking_model.splink_model import get_linker
+    from uk_address_matcher.post_linkage.accuracy_from_labels import (
+        evaluate_predictions_against_labels,
+        inspect_match_results_vs_labels,
+    )
+    from uk_address_matcher.post_linkage.analyse_results import (
+        best_matches_summary,
+        best_matches_with_distinguishability,
+        calculate_match_metrics,
+    )
+    from uk_address_matcher.post_linkage.identify_distinguishing_tokens import (
+        improve_predictions_using_distinguishing_tokens,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "get_linker",
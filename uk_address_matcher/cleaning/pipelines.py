@@ -7,15 +7,15 @@ from uk_address_matcher.cleaning.steps import (
     _add_term_frequencies_to_address_tokens,
     _add_term_frequencies_to_address_tokens_using_registered_df,
     _assign_ukam_address_id,
-    _canonicalise_postcode,
     _clean_address_string_first_pass,
     _clean_address_string_second_pass,
     _derive_original_address_concat,
     _final_column_order,
-    _first_unusual_token,
+    _first_unusual_token_fallback,
     _generalised_token_aliases,
     _get_token_frequeny_table,
     _move_common_end_tokens_to_field,
+    _normalise_address_and_postcode,
     _parse_out_flat_position_and_letter,
     _parse_out_numbers,
     _separate_distinguishing_start_tokens_from_with_respect_to_adjacent_records,
@@ -24,20 +24,16 @@ from uk_address_matcher.cleaning.steps import (
     _tokenise_address_without_numbers,
     _trim_whitespace_address_and_postcode,
     _upper_case_address_and_postcode,
-    _use_first_unusual_token_if_no_numeric_token,
 )
 from uk_address_matcher.cleaning.steps.tokenisation import (
     _create_tokenised_address_concat,
 )
-from uk_address_matcher.sql_pipeline.helpers import _uid
+from uk_address_matcher.sql_pipeline.helpers import _duckdb_table_exists, _uid
 from uk_address_matcher.sql_pipeline.runner import DebugOptions, create_sql_pipeline
 
 QUEUE_PRE_TF = [
     _assign_ukam_address_id,
-    _trim_whitespace_address_and_postcode,
-    _upper_case_address_and_postcode,
-    _canonicalise_postcode,
-    _clean_address_string_first_pass,
+    _normalise_address_and_postcode,
     _derive_original_address_concat,
     _parse_out_flat_position_and_letter,
     _parse_out_numbers,
@@ -56,26 +52,52 @@ QUEUE_PRE_TF_WITH_UNIQUE_AND_COMMON = [
 
 QUEUE_POST_TF = [
     _move_common_end_tokens_to_field,
-    _first_unusual_token,
-    _use_first_unusual_token_if_no_numeric_token,
+    _first_unusual_token_fallback,
     _separate_unusual_tokens,
     _final_column_order,
 ]
 
 
+# Temp table holding the bundled token frequencies, loaded once per connection
+_DEFAULT_REL_TOK_FREQ_TABLE = "__ukam_default_rel_tok_freq"
+
+
+def _default_rel_tok_freq_table(con: DuckDBPyConnection) -> DuckDBPyRelation:
+    if not _duckdb_table_exists(con, _DEFAULT_REL_TOK_FREQ_TABLE):
+        default_tf_path = (
+            resources.files("uk_address_matcher")
+            / "data"
+            / "address_token_frequencies.parquet"
+        )
+        escaped_path = str(default_tf_path).replace("'", "''")
+        con.execute(
+            f"""
+            create temporary table {_DEFAULT_REL_TOK_FREQ_TABLE} as
+            select * from read_parquet('{escaped_path}')
+            """
+        )
+    return con.table(_DEFAULT_REL_TOK_FREQ_TABLE)
+
+
 def _materialise_output_table(
     con: DuckDBPyConnection,
     rel: DuckDBPyRelation,
     uid: str,
     exclude_source_dataset_name: bool = True,
+    materialise: bool = True,
 ) -> DuckDBPyRelation:
-    con.register("__address_table_res", rel)
     has_source_dataset = "source_dataset" in rel.columns
     exclude_clause = (
         "EXCLUDE (source_dataset)"
         if has_source_dataset and exclude_source_dataset_name
         else ""
     )
+    if not materialise:
+        # Leave the pipeline lazy so callers can stream it (e.g. to parquet)
+        # without writing a full copy into a temp table first
+        return rel.project(f"* {exclude_clause}")
+
+    con.register("__address_table_res", rel)
     materialised_name = f"__address_table_cleaned_{uid}"
     con.execute(
         f"""
@@ -91,6 +113,7 @@ def clean_data_with_minimal_steps(
     con: DuckDBPyConnection,
     *,
     debug_options: Optional[DebugOptions] = None,
+    materialise: bool = True,
 ) -> DuckDBPyRelation:
     pipeline = create_sql_pipeline(
         con,
@@ -101,7 +124,11 @@ def clean_data_with_minimal_steps(
     )
     table_rel = pipeline.run(debug_options)
     return _materialise_output_table(
-        con, table_rel, _uid(), exclude_source_dataset_name=False
+        con,
+        table_rel,
+        _uid(),
+        exclude_source_dataset_name=False,
+        materialise=materialise,
     )
 
 
@@ -110,6 +137,7 @@ def clean_data_on_the_fly(
     con: DuckDBPyConnection,
     *,
     debug_options: Optional[DebugOptions] = None,
+    materialise: bool = True,
 ) -> DuckDBPyRelation:
     stage_queue = (
         QUEUE_PRE_TF + [_add_term_frequencies_to_address_tokens] + QUEUE_POST_TF
@@ -126,7 +154,9 @@ def clean_data_on_the_fly(
         ),
     )
     table_rel = pipeline.run(debug_options)
-    return _materialise_output_table(con, table_rel, _uid())
+    return _materialise_output_table(
+        con, table_rel, _uid(), materialise=materialise
+    )
 
 
 def clean_data_using_precomputed_rel_tok_freq(
@@ -136,16 +166,17 @@ def clean_data_using_precomputed_rel_tok_freq(
     derive_distinguishing_wrt_adjacent_records: bool = False,
     *,
     debug_options: Optional[DebugOptions] = None,
+    materialise: bool = True,
 ) -> DuckDBPyRelation:
     if rel_tok_freq_table is None:
-        default_tf_path = (
-            resources.files("uk_address_matcher")
-            / "data"
-            / "address_token_frequencies.parquet"
-        )
-        rel_tok_freq_table = con.read_parquet(str(default_tf_path))
+        rel_tok_freq_table = _default_rel_tok_freq_table(con)
 
-    con.register("rel_tok_freq", rel_tok_freq_table)
+    # A per-call name, so a lazy result from an earlier call on this
+    # connection keeps reading the frequencies it was built with. A lazy
+    # result resolves the view whenever it runs, so the view stays registered
+    # for as long as that relation is in use; a materialised result drops it
+    rel_tok_freq_name = f"rel_tok_freq_{_uid()}"
+    con.register(rel_tok_freq_name, rel_tok_freq_table)
 
     pre_queue = (
         QUEUE_PRE_TF_WITH_UNIQUE_AND_COMMON
@@ -153,11 +184,11 @@ def clean_data_using_precomputed_rel_tok_freq(
         else QUEUE_PRE_TF
     )
 
-    stage_queue = (
-        pre_queue
-        + [_add_term_frequencies_to_address_tokens_using_registered_df]
-        + QUEUE_POST_TF
-    )
+    stage_queue = [
+        *pre_queue,
+        _add_term_frequencies_to_address_tokens_using_registered_df(rel_tok_freq_name),
+        *QUEUE_POST_TF,
+    ]
 
     pipeline = create_sql_pipeline(
         con,
@@ -169,7 +200,12 @@ def clean_data_using_precomputed_rel_tok_freq(
         ),
     )
     result_rel = pipeline.run(debug_options)
-    return _materialise_output_table(con, result_rel, _uid())
+    cleaned_rel = _materialise_output_table(
+        con, result_rel, _uid(), materialise=materialise
+    )
+    if materialise:
+        con.unregister(rel_tok_freq_name)
+    return cleaned_rel
 
 
 def get_numeric_term_frequencies_from_address_table(
@@ -196,22 +232,20 @@ def get_numeric_term_frequencies_from_address_table(
         ),
     )
     numeric_tokens_rel = pipeline.run(debug_options)
-    numeric_tokens_rel.show()
-    con.register("numeric_tokens_df", numeric_tokens_rel)
 
     sql = """
     with unnested as (
         select unnest(numeric_tokens) as numeric_token
-        from numeric_tokens_df
+        from numeric_tokens
     )
     select
         numeric_token,
-        count(*)/(select count(*) from unnested) as tf_numeric_token
+        count(*) / sum(count(*)) over () as tf_numeric_token
     from unnested
     group by numeric_token
     order by 2 desc
     """
-    return con.sql(sql)
+    return numeric_tokens_rel.query("numeric_tokens", sql)
 
 
 def get_address_token_frequencies_from_address_table(
@@ -5,6 +5,7 @@ from uk_address_matcher.cleaning.steps.normalisation import (
     _canonicalise_postcode,
     _clean_address_string_first_pass,
     _derive_original_address_concat,
+    _normalise_address_and_postcode,
     _remove_duplicate_end_tokens,
     _trim_whitespace_address_and_postcode,
     _upper_case_address_and_postcode,
@@ -14,6 +15,7 @@ from uk_address_matcher.cleaning.steps.term_frequencies import (
     _add_term_frequencies_to_address_tokens_using_registered_df,
     _final_column_order,
     _first_unusual_token,
+    _first_unusual_token_fallback,
     _get_token_frequeny_table,
     _move_common_end_tokens_to_field,
     _separate_unusual_tokens,
@@ -44,6 +46,7 @@ __all__ = [
     "_canonicalise_postcode",
     "_upper_case_address_and_postcode",
     "_clean_address_string_first_pass",
+    "_normalise_address_and_postcode",
     "_remove_duplicate_end_tokens",
     "_derive_original_address_concat",
     "_assign_ukam_address_id",
@@ -55,6 +58,7 @@ __all__ = [
     "_add_term_frequencies_to_address_tokens_using_registered_df",
     "_move_common_end_tokens_to_field",
     "_first_unusual_token",
+    "_first_unusual_token_fallback",
     "_use_first_unusual_token_if_no_numeric_token",
     "_separate_unusual_tokens",
     "_final_column_order",
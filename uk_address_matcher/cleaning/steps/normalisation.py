@@ -4,11 +4,9 @@ from typing import Final
 
 from uk_address_matcher.cleaning.steps.regexes import (
     construct_nested_call,
+    map_punctuation,
     move_flat_to_front,
-    remove_apostrophes,
-    remove_commas_periods,
     remove_multiple_spaces,
-    replace_fwd_slash_with_dash,
     separate_letter_num,
     standarise_num_letter,
     trim,
@@ -47,6 +45,13 @@ def _trim_whitespace_address_and_postcode() -> str:
     return sql
 
 
+UK_POSTCODE_REGEX: Final[str] = r"^([A-Z]{1,2}\d[A-Z\d]?|GIR)\s*(\d[A-Z]{2})$"
+
+
+def _canonical_postcode_expr(postcode: str) -> str:
+    return f"regexp_replace({postcode}, '{UK_POSTCODE_REGEX}', '\\1 \\2')"
+
+
 @pipeline_stage(
     name="canonicalise_postcode",
     description="Standardise UK postcodes by ensuring single space between outward and inward codes",
@@ -57,15 +62,10 @@ def _canonicalise_postcode() -> str:
     Ensures that any postcode matching the UK format has a single space
     separating the outward and inward codes. Assumes 'postcode' is trimmed and uppercased.
     """
-    uk_postcode_regex: Final[str] = r"^([A-Z]{1,2}\d[A-Z\d]?|GIR)\s*(\d[A-Z]{2})$"
     sql = f"""
     SELECT
         * EXCLUDE (postcode),
-        regexp_replace(
-            postcode,
-            '{uk_postcode_regex}',
-            '\\1 \\2'
-        ) AS postcode
+        {_canonical_postcode_expr("postcode")} AS postcode
     FROM {{input}}
     """
     return sql
@@ -87,27 +87,28 @@ def _upper_case_address_and_postcode() -> str:
     return sql
 
 
+FIRST_PASS_CLEANING_FNS = [
+    # Stands in for remove_commas_periods, remove_apostrophes and
+    # replace_fwd_slash_with_dash; none of them touch whitespace, so they
+    # commute with remove_multiple_spaces
+    map_punctuation,
+    remove_multiple_spaces,
+    # standarise_num_dash_num,  # left commented as in original
+    separate_letter_num,
+    standarise_num_letter,
+    move_flat_to_front,
+    # remove_repeated_tokens,   # left commented as in original
+    trim,
+]
+
+
 @pipeline_stage(
     name="clean_address_string_first_pass",
     description="Apply initial address cleaning operations: remove punctuation, standardise separators, and normalise formatting",
     tags=["cleaning", "normalisation"],
 )
 def _clean_address_string_first_pass() -> str:
-    fn_call = construct_nested_call(
-        "address_concat",
-        [
-            remove_commas_periods,
-            remove_apostrophes,
-            remove_multiple_spaces,
-            replace_fwd_slash_with_dash,
-            # standarise_num_dash_num,  # left commented as in original
-            separate_letter_num,
-            standarise_num_letter,
-            move_flat_to_front,
-            # remove_repeated_tokens,   # left commented as in original
-            trim,
-        ],
-    )
+    fn_call = construct_nested_call("address_concat", FIRST_PASS_CLEANING_FNS)
     sql = f"""
     SELECT
         * EXCLUDE (address_concat),
@@ -117,6 +118,32 @@ def _clean_address_string_first_pass() -> str:
     return sql
 
 
+@pipeline_stage(
+    name="normalise_address_and_postcode",
+    description="Trim, upper case and first-pass clean the address, and canonicalise the postcode, in one projection",
+    tags=["normalisation", "cleaning"],
+)
+def _normalise_address_and_postcode() -> str:
+    """
+    Equivalent to running trim_whitespace_address_and_postcode,
+    upper_case_address_and_postcode, canonicalise_postcode and
+    clean_address_string_first_pass in turn, but as a single projection so the
+    untouched columns are only carried through once.
+    """
+    address_expr = construct_nested_call(
+        "UPPER(TRIM(address_concat))", FIRST_PASS_CLEANING_FNS
+    )
+    postcode_expr = _canonical_postcode_expr("UPPER(TRIM(postcode))")
+    sql = f"""
+    SELECT
+        * EXCLUDE (address_concat, postcode),
+        {postcode_expr} AS postcode,
+        {address_expr} AS address_concat
+    FROM {{input}}
+    """
+    return sql
+
+
 @pipeline_stage(
     name="remove_duplicate_end_tokens",
     description="Remove duplicated tokens at the end of addresses (e.g. 'HIGH STREET ST ALBANS ST ALBANS' -> 'HIGH STREET ST ALBANS')",
@@ -9,6 +9,18 @@ def remove_apostrophes(input: str):
     return f"regexp_replace({input}, e'\\'', '', 'g')"
 
 
+def map_punctuation(input: str):
+    """
+    Single-character rewrites in one pass: commas and periods become spaces,
+    forward slashes become dashes and apostrophes are removed.
+
+    Equivalent to remove_commas_periods, remove_apostrophes and
+    replace_fwd_slash_with_dash, but uses translate rather than three regex
+    passes.
+    """
+    return f"translate({input}, ',./''', '  -')"
+
+
 def remove_multiple_spaces(input: str):
     return f"regexp_replace({input}, '\\s+', ' ', 'g')"
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import csv
 import importlib.resources as pkg_resources
+from functools import cache
 
 from uk_address_matcher.sql_pipeline.steps import CTEStep, pipeline_stage
 
@@ -11,70 +13,76 @@ from uk_address_matcher.sql_pipeline.steps import CTEStep, pipeline_stage
     tags="term_frequency_analysis",
 )
 def _add_term_frequencies_to_address_tokens():
-    """Compute token-level relative frequencies and attach them to each record."""
+    """Compute token-level relative frequencies and attach them to each record.
 
-    base_sql = """
-    SELECT * FROM {input}
+    Reaggregates the same way as the precomputed variant below: only
+    (token_order, rel_freq) pairs go through the aggregate.
     """
 
-    rel_tok_freq_cte_sql = """
-    SELECT
-        token,
-        count(*) / sum(count(*)) OVER () AS rel_freq
-    FROM (
-        SELECT
-            unnest(address_without_numbers_tokenised) AS token
-        FROM {base}
-    )
-    GROUP BY token
+    base_sql = """
+    SELECT * FROM {input}
     """
 
+    # Keyed on ukam_address_id, which is unique per row; the caller's
+    # unique_id may repeat, so it cannot key the join back to each record
     addresses_exploded_sql = """
     SELECT
-        unique_id,
+        ukam_address_id,
         unnest(address_without_numbers_tokenised) AS token,
         generate_subscripts(address_without_numbers_tokenised, 1) AS token_order
     FROM {base}
     """
 
-    address_groups_sql = """
+    # Frequencies come from the same exploded rows rather than a second unnest
+    rel_tok_freq_cte_sql = """
     SELECT
-        {addresses_exploded}.*,
+        token,
+        count(*) / sum(count(*)) OVER () AS rel_freq
+    FROM {addresses_exploded}
+    GROUP BY token
+    """
+
+    joined_scalars_sql = """
+    SELECT
+        {addresses_exploded}.ukam_address_id,
+        {addresses_exploded}.token_order,
         COALESCE({rel_tok_freq_cte}.rel_freq, 5e-5) AS rel_freq
     FROM {addresses_exploded}
     LEFT JOIN {rel_tok_freq_cte}
         ON {addresses_exploded}.token = {rel_tok_freq_cte}.token
     """
 
-    token_freq_lookup_sql = """
+    reaggregated_freqs_sql = """
     SELECT
-        unique_id,
+        ukam_address_id,
         list_transform(
-            list_zip(
-                array_agg(token ORDER BY unique_id, token_order ASC),
-                array_agg(rel_freq ORDER BY unique_id, token_order ASC)
+            list_sort(
+                list(struct_pack(token_order := token_order, rel_freq := rel_freq))
             ),
-            x -> struct_pack(tok := x[1], rel_freq := x[2])
-        ) AS token_rel_freq_arr
-    FROM {address_groups}
-    GROUP BY unique_id
+            x -> x.rel_freq
+        ) AS rel_freq_arr
+    FROM {joined_scalars}
+    GROUP BY ukam_address_id
     """
 
     final_sql = """
     SELECT
         base.* EXCLUDE (address_without_numbers_tokenised),
-        lookup.token_rel_freq_arr
+        list_transform(
+            list_zip(base.address_without_numbers_tokenised, freqs.rel_freq_arr),
+            x -> struct_pack(tok := x[1], rel_freq := x[2])
+        ) AS token_rel_freq_arr
     FROM {base} AS base
-    INNER JOIN {token_freq_lookup} AS lookup
-        ON base.unique_id = lookup.unique_id
+    INNER JOIN {reaggregated_freqs} AS freqs
+        ON base.ukam_address_id = freqs.ukam_address_id
     """
 
     steps = [
         CTEStep("base", base_sql),
-        CTEStep("rel_tok_freq_cte", rel_tok_freq_cte_sql),
         CTEStep("addresses_exploded", addresses_exploded_sql),
-        CTEStep("address_groups", address_groups_sql),
-        CTEStep("token_freq_lookup", token_freq_lookup_sql),
+        CTEStep("rel_tok_freq_cte", rel_tok_freq_cte_sql),
+        CTEStep("joined_scalars", joined_scalars_sql),
+        CTEStep("reaggregated_freqs", reaggregated_freqs_sql),
         CTEStep("final", final_sql),
     ]
 
@@ -86,64 +94,104 @@ def _add_term_frequencies_to_address_tokens():
     description="Attach precomputed token frequencies from registered DataFrame rel_tok_freq",
     tags="term_frequency_analysis",
 )
-def _add_term_frequencies_to_address_tokens_using_registered_df():
-    """Attach precomputed token frequencies registered as rel_tok_freq."""
+def _add_term_frequencies_to_address_tokens_using_registered_df(
+    rel_tok_freq_table: str = "rel_tok_freq",
+):
+    """Attach precomputed token frequencies registered as rel_tok_freq.
+
+    Only the (token_order, rel_freq) scalars are aggregated; the token strings
+    are zipped back from the original list, so the aggregate never carries
+    them.
+
+    Args:
+        rel_tok_freq_table: Name the token frequency relation is registered
+            under on the connection.
+    """
 
     base_sql = """
     SELECT * FROM {input}
     """
 
+    # Keyed on ukam_address_id, which is unique per row; the caller's
+    # unique_id may repeat, so it cannot key the join back to each record
     addresses_exploded_sql = """
     SELECT
-        unique_id,
+        ukam_address_id,
         unnest(address_without_numbers_tokenised) AS token,
         generate_subscripts(address_without_numbers_tokenised, 1) AS token_order
     FROM {base}
     """
 
-    address_groups_sql = """
+    joined_scalars_sql = f"""
     SELECT
-        {addresses_exploded}.*,
+        {{addresses_exploded}}.ukam_address_id,
+        {{addresses_exploded}}.token_order,
         COALESCE(rel_tok_freq.rel_freq, 5e-5) AS rel_freq
-    FROM {addresses_exploded}
-    LEFT JOIN rel_tok_freq
-        ON {addresses_exploded}.token = rel_tok_freq.token
+    FROM {{addresses_exploded}}
+    LEFT JOIN {rel_tok_freq_table} AS rel_tok_freq
+        ON {{addresses_exploded}}.token = rel_tok_freq.token
     """
 
-    token_freq_lookup_sql = """
+    # An ordered aggregate sorts each group's rows; collecting the pairs
+    # unordered and sorting the (short) per-record list afterwards is far
+    # cheaper and still deterministic
+    reaggregated_freqs_sql = """
     SELECT
-        unique_id,
+        ukam_address_id,
         list_transform(
-            list_zip(
-                array_agg(token ORDER BY unique_id, token_order ASC),
-                array_agg(rel_freq ORDER BY unique_id, token_order ASC)
+            list_sort(
+                list(struct_pack(token_order := token_order, rel_freq := rel_freq))
             ),
-            x -> struct_pack(tok := x[1], rel_freq := x[2])
-        ) AS token_rel_freq_arr
-    FROM {address_groups}
-    GROUP BY unique_id
+            x -> x.rel_freq
+        ) AS rel_freq_arr
+    FROM {joined_scalars}
+    GROUP BY ukam_address_id
     """
 
     final_sql = """
     SELECT
         base.* EXCLUDE (address_without_numbers_tokenised),
-        lookup.token_rel_freq_arr
+        list_transform(
+            list_zip(base.address_without_numbers_tokenised, freqs.rel_freq_arr),
+            x -> struct_pack(tok := x[1], rel_freq := x[2])
+        ) AS token_rel_freq_arr
     FROM {base} AS base
-    INNER JOIN {token_freq_lookup} AS lookup
-        ON base.unique_id = lookup.unique_id
+    INNER JOIN {reaggregated_freqs} AS freqs
+        ON base.ukam_address_id = freqs.ukam_address_id
     """
 
     steps = [
         CTEStep("base", base_sql),
         CTEStep("addresses_exploded", addresses_exploded_sql),
-        CTEStep("address_groups", address_groups_sql),
-        CTEStep("token_freq_lookup", token_freq_lookup_sql),
+        CTEStep("joined_scalars", joined_scalars_sql),
+        CTEStep("reaggregated_freqs", reaggregated_freqs_sql),
         CTEStep("final", final_sql),
     ]
 
     return steps
 
 
+@cache
+def _common_end_tokens_literal() -> str:
+    """Return the common end tokens (token_count > 3000) as a SQL list literal.
+
+    The CSV is bundled with the package, so it is read once per process and
+    baked into the SQL rather than re-read and cross joined on every run.
+    """
+    csv_file = (
+        pkg_resources.files("uk_address_matcher.data") / "common_end_tokens.csv"
+    )
+    with csv_file.open(newline="") as f:
+        tokens = [
+            row["token"]
+            for row in csv.DictReader(f)
+            # Empty tokens were read as NULL and so never matched
+            if row["token"] and int(row["token_count"]) > 3000
+        ]
+    quoted = ", ".join("'" + token.replace("'", "''") + "'" for token in tokens)
+    return f"[{quoted}]"
+
+
 @pipeline_stage(
     name="move_common_end_tokens_to_field",
     description="Move frequently occurring trailing tokens (e.g. counties) into a dedicated field and remove from token frequency array",
@@ -159,19 +207,13 @@ def _move_common_end_tokens_to_field():
     SELECT * FROM {input}
     """
 
-    with pkg_resources.path(
-        "uk_address_matcher.data", "common_end_tokens.csv"
-    ) as csv_path:
-        common_end_tokens_sql = f"""
-            select array_agg(token) as end_tokens_to_remove
-            from read_csv_auto('{csv_path}')
-            where token_count > 3000
-            """
-
-    joined_sql = """
-    SELECT *
-    FROM {base}
-    CROSS JOIN {common_end_tokens}
+    # Project the list as a column: a constant list inside the lambda below
+    # would be rebuilt for every token
+    joined_sql = f"""
+    SELECT
+        *,
+        {_common_end_tokens_literal()} AS end_tokens_to_remove
+    FROM {{base}}
     """
 
     end_tokens_included_sql = """
@@ -184,34 +226,68 @@ def _move_common_end_tokens_to_field():
     FROM {joined}
     """
 
+    # Extract the token names once per row rather than inside the filter
+    # lambda below, where they would be rebuilt for every token
+    end_token_names_sql = """
+    SELECT
+        *,
+        list_transform(common_end_tokens, x -> x.tok) AS common_end_token_names
+    FROM {end_tokens_included}
+    """
+
+    # Only the last two tokens are candidates for removal, so filter just that
+    # tail rather than every token. Slice bounds are inclusive, hence [:-3]
     remove_end_tokens_expr = """
-    list_filter(
-        token_rel_freq_arr,
-        (x, i) -> NOT (
-            i > len(token_rel_freq_arr) - 2
-            AND list_contains(list_transform(common_end_tokens, x -> x.tok), x.tok)
-        )
+    token_rel_freq_arr[:-3]
+    || list_filter(
+        token_rel_freq_arr[-2:],
+        x -> NOT list_contains(common_end_token_names, x.tok)
     )
     """
 
     final_sql = f"""
     SELECT
-        * EXCLUDE (token_rel_freq_arr),
+        * EXCLUDE (token_rel_freq_arr, common_end_token_names),
         {remove_end_tokens_expr} AS token_rel_freq_arr
-    FROM {{end_tokens_included}}
+    FROM {{end_token_names}}
     """
 
     steps = [
         CTEStep("base", base_sql),
-        CTEStep("common_end_tokens", common_end_tokens_sql),
         CTEStep("joined", joined_sql),
         CTEStep("end_tokens_included", end_tokens_included_sql),
+        CTEStep("end_token_names", end_token_names_sql),
         CTEStep("final", final_sql),
     ]
 
     return steps
 
 
+FIRST_UNUSUAL_TOKEN_EXPR = (
+    "list_any_value(list_filter(token_rel_freq_arr, x -> x.rel_freq < 0.001))"
+)
+
+
+def _first_unusual_token_fallback_sql(source: str) -> str:
+    return f"""
+    SELECT
+        * EXCLUDE (numeric_token_1, token_rel_freq_arr, first_unusual_token),
+        CASE
+            WHEN numeric_token_1 IS NULL THEN first_unusual_token.tok
+            ELSE numeric_token_1
+        END AS numeric_token_1,
+        CASE
+            WHEN numeric_token_1 IS NULL THEN
+                list_filter(
+                    token_rel_freq_arr,
+                    x -> coalesce(x.tok != first_unusual_token.tok, TRUE)
+                )
+            ELSE token_rel_freq_arr
+        END AS token_rel_freq_arr
+    FROM {source}
+    """
+
+
 @pipeline_stage(
     name="first_unusual_token",
     description="Attach the first token below the frequency threshold (0.001) if present",
@@ -220,13 +296,9 @@ def _move_common_end_tokens_to_field():
 def _first_unusual_token():
     """Attach the first token below the frequency threshold (0.001) if present."""
 
-    first_token_expr = (
-        "list_any_value(list_filter(token_rel_freq_arr, x -> x.rel_freq < 0.001))"
-    )
-
     sql = f"""
     SELECT
-        {first_token_expr} AS first_unusual_token,
+        {FIRST_UNUSUAL_TOKEN_EXPR} AS first_unusual_token,
         *
     FROM {{input}}
     """
@@ -241,24 +313,41 @@ def _first_unusual_token():
 def _use_first_unusual_token_if_no_numeric_token():
     """Fallback to the unusual token when numeric_token_1 is missing."""
 
-    sql = """
+    return _first_unusual_token_fallback_sql("{input}")
+
+
+@pipeline_stage(
+    name="first_unusual_token_fallback",
+    description="Use the first unusual token (frequency < 0.001) as numeric_token_1 when it is missing",
+    tags="term_frequency_analysis",
+)
+def _first_unusual_token_fallback():
+    """
+    Equivalent to first_unusual_token followed by
+    use_first_unusual_token_if_no_numeric_token, in one stage.
+
+    The unusual token is only looked up for records without a numeric_token_1,
+    the only ones that use it. It stays a column rather than being inlined
+    into the filter lambda, which would re-evaluate it for every token.
+    """
+
+    with_first_unusual_token_sql = f"""
     SELECT
-        * EXCLUDE (numeric_token_1, token_rel_freq_arr, first_unusual_token),
-        CASE
-            WHEN numeric_token_1 IS NULL THEN first_unusual_token.tok
-            ELSE numeric_token_1
-        END AS numeric_token_1,
+        *,
         CASE
-            WHEN numeric_token_1 IS NULL THEN
-                list_filter(
-                    token_rel_freq_arr,
-                    x -> coalesce(x.tok != first_unusual_token.tok, TRUE)
-                )
-            ELSE token_rel_freq_arr
-        END AS token_rel_freq_arr
-    FROM {input}
+            WHEN numeric_token_1 IS NULL THEN {FIRST_UNUSUAL_TOKEN_EXPR}
+        END AS first_unusual_token
+    FROM {{input}}
     """
-    return sql
+
+    steps = [
+        CTEStep("with_first_unusual_token", with_first_unusual_token_sql),
+        CTEStep(
+            "final", _first_unusual_token_fallback_sql("{with_first_unusual_token}")
+        ),
+    ]
+
+    return steps
 
 
 @pipeline_stage(
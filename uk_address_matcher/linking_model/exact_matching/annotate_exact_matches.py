@@ -37,13 +37,13 @@ def _annotate_exact_matches(
     # a single address appears multiple times in the canonical dataset. This should be
     # reviewed later to see if we can improve handling of these cases.
     exact_value = MatchReason.EXACT.value
-    enum_values = str(MatchReason.enum_values())
+    enum_literal = MatchReason.enum_literal()
     annotated_sql = f"""
         SELECT
             fuzzy.ukam_address_id AS ukam_address_id,
             matched_canon.ukam_address_id AS canonical_ukam_address_id,
             matched_canon.canonical_unique_id AS resolved_canonical_id,
-            '{exact_value}'::ENUM {enum_values} as match_reason
+            '{exact_value}'::ENUM({enum_literal}) as match_reason
         FROM {{{fuzzy_input_name}}} AS fuzzy
         INNER JOIN LATERAL (
             SELECT
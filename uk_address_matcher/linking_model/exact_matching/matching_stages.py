@@ -278,7 +278,7 @@ def run_deterministic_match_pass(
         df_fuzzy_unmatched = _get_unmatched_subset(df_addresses_to_match, matches_union)
 
         # Early exit if nothing left to match
-        if df_fuzzy_unmatched.count("*").fetchone()[0] == 0:
+        if df_fuzzy_unmatched.limit(1).fetchone() is None:
             break
 
         stage_result = _run_stage(
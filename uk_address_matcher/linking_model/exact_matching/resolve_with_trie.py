@@ -36,13 +36,13 @@ def _resolve_with_trie() -> list[CTEStep]:
 
     # Join back to canonical to get the canonical_unique_id and create final output
     trie_value = MatchReason.TRIE.value
-    enum_values = str(MatchReason.enum_values())
+    enum_literal = MatchReason.enum_literal()
     trie_matches_sql = f"""
         SELECT
             candidates.fuzzy_ukam_address_id AS ukam_address_id,
             candidates.canonical_ukam_address_id AS canonical_ukam_address_id,
             canon.canonical_unique_id AS resolved_canonical_id,
-            '{trie_value}'::ENUM {enum_values} AS match_reason
+            '{trie_value}'::ENUM({enum_literal}) AS match_reason
         FROM {{raw_trie_matches}} AS candidates
         JOIN {{canonical_addresses_restricted}} AS canon
           ON candidates.canonical_ukam_address_id = canon.ukam_address_id
@@ -31,7 +31,7 @@ def _resolve_with_trigrams(
     include_trigram_text: bool = False,
 ) -> list[CTEStep]:
     trigram_value = MatchReason.UNIQUE_TRIGRAM.value
-    enum_values = str(MatchReason.enum_values())
+    enum_literal = MatchReason.enum_literal()
 
     trigram_text_projection = (
         ", array_to_string(tri, ' ') AS trigram_text" if include_trigram_text else ""
@@ -140,7 +140,7 @@ def _resolve_with_trigrams(
             resolved_canonical_id,
             trigram_hit_count,
             supporting_trigram_hashes,
-            '{trigram_value}'::ENUM {enum_values} AS match_reason
+            '{trigram_value}'::ENUM({enum_literal}) AS match_reason
             {supporting_text_select}
         FROM {{trigram_one_to_one_links}}
     """
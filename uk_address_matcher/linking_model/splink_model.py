@@ -52,15 +52,14 @@ def get_linker(
         ).select(
             "* EXCLUDE(match_reason, resolved_canonical_id, canonical_ukam_address_id)"
         )
-    unresolved_count = df_addresses_to_match.count("*").fetchall()[0][0]
-    if unresolved_count == 0:
+    # Emptiness checks only need one row, not a full COUNT(*) pass
+    if df_addresses_to_match.limit(1).fetchone() is None:
         raise ValueError(
             "No unresolved records remain after deterministic matching. Either "
             "skip Splink or provide rows with unresolved matches."
         )
 
-    canonical_count = df_addresses_to_search_within.count("*").fetchall()[0][0]
-    if canonical_count == 0:
+    if df_addresses_to_search_within.limit(1).fetchone() is None:
         raise ValueError(
             "Canonical relation is empty - Splink requires at least one search record."
         )
@@ -23,11 +23,16 @@ def _prepare_splink_candidates(
     *,
     match_weight_threshold: float,
     distinguishability_threshold: Optional[float],
+    exclude_exact_matches: bool = False,
 ) -> list[CTEStep]:
-    """Filter Splink matches and retain the best candidate for each fuzzy ID."""
+    """Filter Splink matches and retain the best candidate for each fuzzy ID.
 
-    enum_values = MatchReason.enum_values()
-    enum_literal = ", ".join(f"'{value}'" for value in enum_values)
+    When ``exclude_exact_matches`` is set, candidates for records already
+    resolved in ``{exact_matches}`` are dropped before ranking, so the top-1
+    aggregate only runs over records that still need a Splink match.
+    """
+
+    enum_literal = MatchReason.enum_literal()
     splink_label = MatchReason.SPLINK.value.replace("'", "''")
 
     distinguishability_filter = ""
@@ -37,32 +42,60 @@ def _prepare_splink_candidates(
             f"AND distinguishability >= {distinguishability_threshold}"
         )
 
+    exact_matches_filter = ""
+    if exclude_exact_matches:
+        exact_matches_filter = """
+            ANTI JOIN {exact_matches} AS exact
+                ON candidates.ukam_address_id_r = exact.ukam_address_id
+                AND exact.match_reason IS NOT NULL
+        """
+
     # _r = record from addresses to match (fuzzy)
     # _l = record from addresses to search within (canonical)
+    # arg_min over a struct key picks the same row as ordering by
+    # match_weight DESC, distinguishability DESC NULLS LAST, unique_id_l, but in
+    # a single hash aggregate rather than a per-partition window sort.
     top_sql = f"""
-        SELECT
-            unique_id_r AS unique_id,
-            ukam_address_id_r as ukam_address_id,
-            unique_id_l AS resolved_canonical_id,
-            ukam_address_id_l as canonical_ukam_address_id,
-            address_concat_r as original_address_concat,
-            postcode_r as postcode,
-            match_weight,
-            distinguishability,
-            distinguishability_category,
-            '{splink_label}'::ENUM({enum_literal}) AS match_reason
-        FROM (
+        WITH best_candidates AS (
             SELECT
-                *,
-                ROW_NUMBER() OVER (
-                    PARTITION BY unique_id_r
-                    ORDER BY match_weight DESC, distinguishability DESC NULLS LAST, unique_id_l
-                ) AS match_rank
-            FROM {{splink_matches}}
+                unique_id_r,
+                arg_min(
+                    struct_pack(
+                        unique_id_l := unique_id_l,
+                        ukam_address_id_l := ukam_address_id_l,
+                        ukam_address_id_r := ukam_address_id_r,
+                        address_concat_r := address_concat_r,
+                        postcode_r := postcode_r,
+                        match_weight := match_weight,
+                        distinguishability := distinguishability,
+                        distinguishability_category := distinguishability_category
+                    ),
+                    struct_pack(
+                        neg_match_weight := -match_weight,
+                        neg_distinguishability := COALESCE(
+                            -distinguishability, 'inf'::DOUBLE
+                        ),
+                        unique_id_l := unique_id_l
+                    )
+                ) AS best
+            FROM {{splink_matches}} AS candidates
+            {exact_matches_filter}
             WHERE match_weight >= {match_weight_threshold}
             {distinguishability_filter}
-        ) AS ranked
-        WHERE match_rank = 1
+            GROUP BY unique_id_r
+        )
+        SELECT
+            unique_id_r AS unique_id,
+            best.ukam_address_id_r as ukam_address_id,
+            best.unique_id_l AS resolved_canonical_id,
+            best.ukam_address_id_l as canonical_ukam_address_id,
+            best.address_concat_r as original_address_concat,
+            best.postcode_r as postcode,
+            best.match_weight AS match_weight,
+            best.distinguishability AS distinguishability,
+            best.distinguishability_category AS distinguishability_category,
+            '{splink_label}'::ENUM({enum_literal}) AS match_reason
+        FROM best_candidates
     """
 
     return [CTEStep("splink_top", top_sql)]
@@ -75,7 +108,13 @@ def _prepare_splink_candidates(
     stage_output="match_candidates",
 )
 def _combine_exact_and_splink_matches(*, include_unmatched: bool) -> list[CTEStep]:
-    """Join exact and Splink matches with canonical address details."""
+    """Join exact and Splink matches with canonical address details.
+
+    Splink candidates for records already resolved in ``{exact_matches}`` are
+    dropped here too. ``select_top_match_candidates`` already drops them
+    before ranking (``exclude_exact_matches=True`` in
+    ``_prepare_splink_candidates``), but this stage must not depend on that.
+    """
 
     canonical_sql = """
         SELECT
@@ -95,17 +134,35 @@ def _combine_exact_and_splink_matches(*, include_unmatched: bool) -> list[CTESte
         match_reason
     """
 
-    # When include_unmatched=True, we need to exclude unmatched records that got a Splink match
-    # When include_unmatched=False, we exclude all unmatched records
+    # Exact matches as a key set, so Splink candidates can be excluded with a
+    # single anti join rather than a NOT IN subquery per branch
+    exact_ids_sql = """
+        SELECT ukam_address_id
+        FROM {exact_matches}
+        WHERE match_reason IS NOT NULL
+    """
+
+    # When include_unmatched=True, unmatched exact-pass records are kept unless
+    # they got a Splink match. When include_unmatched=False, they are dropped.
     if include_unmatched:
-        exact_filter = """
-            WHERE match_reason IS NOT NULL
-            OR (match_reason IS NULL AND ukam_address_id NOT IN (SELECT ukam_address_id FROM {splink_top}))
+        unmatched_sql = f"""
+
+        UNION ALL
+
+        SELECT
+            {common_fields},
+            NULL AS match_weight,
+            NULL AS distinguishability,
+            NULL AS distinguishability_category
+        FROM {{exact_matches}} AS e
+        ANTI JOIN {{splink_top}} AS s
+            ON e.ukam_address_id = s.ukam_address_id
+        WHERE e.match_reason IS NULL
         """
     else:
-        exact_filter = "WHERE match_reason IS NOT NULL"
+        unmatched_sql = ""
 
-    # Union exact matches and Splink matches
+    # Union exact matches, Splink-only matches and (optionally) unmatched rows
     union_sql = f"""
         SELECT
             {common_fields},
@@ -113,7 +170,7 @@ def _combine_exact_and_splink_matches(*, include_unmatched: bool) -> list[CTESte
             NULL AS distinguishability,
             NULL AS distinguishability_category
         FROM {{exact_matches}}
-        {exact_filter}
+        WHERE match_reason IS NOT NULL
 
         UNION ALL
 
@@ -122,11 +179,12 @@ def _combine_exact_and_splink_matches(*, include_unmatched: bool) -> list[CTESte
             match_weight,
             distinguishability,
             distinguishability_category
-        FROM {{splink_top}}
-        -- Ensures we don't duplicate exact matches if they also appear in Splink
-        WHERE ukam_address_id NOT IN (
-            SELECT ukam_address_id FROM {{exact_matches}} WHERE match_reason IS NOT NULL
-        )
+        FROM {{splink_top}} AS s
+        -- Ensures we don't duplicate exact matches if they also appear in
+        -- Splink. Cheap: splink_top holds one row per record
+        ANTI JOIN {{exact_ids}} AS e
+            ON s.ukam_address_id = e.ukam_address_id
+        {unmatched_sql}
     """
 
     # Join with canonical addresses to get canonical address details
@@ -152,6 +210,7 @@ def _combine_exact_and_splink_matches(*, include_unmatched: bool) -> list[CTESte
 
     return [
         CTEStep("canonical_projection", canonical_sql),
+        CTEStep("exact_ids", exact_ids_sql),
         CTEStep("combined_matches", union_sql),
         CTEStep("match_candidates", final_sql),
     ]
@@ -179,6 +238,11 @@ def select_top_match_candidates(
         distinguishability_threshold: Minimum distinguishability for Splink matches
         include_unmatched: If True, include unmatched records from exact_matches
         debug_options: Debug options for pipeline execution
+
+    Returns:
+        A lazy DuckDBPyRelation over the combined matches. Nothing is
+        materialised here, so callers can stream it (e.g. to parquet) or
+        convert it with ``.df()`` as needed.
     """
 
     pipeline = create_sql_pipeline(
@@ -192,6 +256,7 @@ def select_top_match_candidates(
             _prepare_splink_candidates(
                 match_weight_threshold=match_weight_threshold,
                 distinguishability_threshold=distinguishability_threshold,
+                exclude_exact_matches=True,
             ),
             _combine_exact_and_splink_matches(include_unmatched=include_unmatched),
         ],
@@ -110,10 +110,11 @@ def _emit_debug(msg: str) -> None:
         print(msg)
 
 
+_UID_ALPHABET = string.ascii_lowercase + string.digits
+
+
 def _uid(n: int = 6) -> str:
-    return "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(n)
-    )
+    return "".join(random.choices(_UID_ALPHABET, k=n))
 
 
 def _slug(s: str) -> str:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cache
 
 
 class MatchReason(Enum):
@@ -25,3 +26,15 @@ class MatchReason(Enum):
         """Return values in definition order for use with DuckDB ENUMs."""
 
         return tuple(member.value for member in cls)
+
+    @classmethod
+    @cache
+    def enum_literal(cls) -> str:
+        """Return the quoted, comma-separated values for a DuckDB ``ENUM(...)``.
+
+        Built once per class, as every pipeline build interpolates it.
+        """
+
+        return ", ".join(
+            "'" + value.replace("'", "''") + "'" for value in cls.enum_values()
+        )
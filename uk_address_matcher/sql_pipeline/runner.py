@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from dataclasses import dataclass
 from time import perf_counter
 from types import MappingProxyType
@@ -34,6 +35,9 @@ from uk_address_matcher.sql_pipeline.steps import Stage
 
 logger = logging.getLogger("uk_address_matcher")
 
+# Matches `{name}` placeholders in stage SQL; unknown names are left untouched
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
 StageFactory = Callable[[], Stage]
 StageLike = Union[Stage, StageFactory]
 
@@ -169,9 +173,11 @@ def render_step_to_ctes(
         alias = f"s{step_idx}_{_slug(step.name)}__{_slug(frag.name)}"
         replacements = {**base_mapping, **frag_aliases}
 
-        sql = frag.sql
-        for key, target in replacements.items():
-            sql = sql.replace(f"{{{key}}}", target)
+        # Single pass over the SQL rather than one str.replace per known alias
+        sql = _PLACEHOLDER_RE.sub(
+            lambda match: replacements.get(match.group(1), match.group(0)),
+            frag.sql,
+        )
 
         ctes.append(
             QueuedFragment(